@@ -1,4 +1,5 @@
 import { createClient } from "@supabase/supabase-js";
+import schemaInfo from "@/data/schema-info.json";
 
 // Supabase設定
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
@@ -14,91 +15,43 @@ export const supabase = createClient(supabaseUrl, supabaseAnonKey);
 /**
  * NOTE: 現在未使用
  * データベーススキーマ情報を取得する
- * オリジナルと同様の方式でinformation_schemaから取得
+ * build_database.py が生成したカタログ（schema-info.json）から取得し、
+ * リクエストごとのテーブル走査・行数カウントは行わない
  */
 export async function getTableSchema(tableName: string) {
-  try {
-    console.log(`=== スキーマ取得開始: ${tableName} ===`);
-
-    // Supabaseでは直接SQLクエリを実行するためのRPC関数が必要
-    // まずは簡易版として、テーブルの存在確認とサンプルデータから推測
-    const { data, error } = await supabase.from(tableName).select("*").limit(1);
-
-    console.log("サンプルデータクエリ結果:", { data, error });
-
-    if (error) {
-      console.error("スキーマ取得エラー:", error);
-
-      // テーブルが存在しない場合のエラーハンドリング
-      if (
-        error.code === "PGRST106" ||
-        error.message.includes("relation") ||
-        error.message.includes("does not exist")
-      ) {
-        return {
-          error: `テーブル "${tableName}" が存在しません。Supabaseにデータをインポートしてください。`,
-          exists: false,
-          columns: [],
-          sampleCount: 0,
-        };
-      }
-
-      return {
-        error: `スキーマ取得に失敗しました: ${error.message}`,
-        exists: false,
-        columns: [],
-        sampleCount: 0,
-      };
-    }
-
-    // テーブルが存在し、データがある場合
-    if (data && data.length > 0) {
-      console.log("サンプルデータあり:", data[0]);
-
-      const columns = Object.keys(data[0]).map((key) => ({
-        column_name: key,
-        data_type: typeof data[0][key] === "number" ? "numeric" : "text",
-      }));
-
-      console.log("カラム情報:", columns);
-
-      // 実際の行数を取得
-      console.log("行数カウント開始...");
-      const { count, error: countError } = await supabase
-        .from(tableName)
-        .select("*", { count: "exact", head: true });
-
-      console.log("行数カウント結果:", { count, error: countError });
-
-      if (countError) {
-        console.error("行数取得エラー:", countError);
-      }
-
-      return {
-        columns,
-        exists: true,
-        sampleCount: count || 0,
-      };
-    }
+  const table = schemaInfo.find(
+    (info) => info.table_physical_name === tableName,
+  );
 
-    // テーブルは存在するがデータが空の場合
-    console.log("データが空、またはアクセス権限なし");
+  if (!table) {
     return {
+      error: `テーブル "${tableName}" が存在しません。Supabaseにデータをインポートしてください。`,
+      exists: false,
       columns: [],
-      exists: true,
       sampleCount: 0,
-      error:
-        "テーブルは存在しますが、データが空です。またはRLSポリシーによりアクセスが制限されています。",
     };
-  } catch (error) {
-    console.error("スキーマ取得中の予期せぬエラー:", error);
+  }
+
+  const columns = table.columns.map((column) => ({
+    column_name: column.column_physical_name,
+    data_type: column.data_type.toLowerCase(),
+  }));
+
+  if (table.row_count === null) {
     return {
-      error: error instanceof Error ? error.message : "Unknown error",
-      exists: false,
-      columns: [],
+      columns,
+      exists: true,
       sampleCount: 0,
+      error:
+        "カタログに統計情報がありません。build_database.py を実行してデータを投入してください。",
     };
   }
+
+  return {
+    columns,
+    exists: true,
+    sampleCount: table.row_count,
+  };
 }
 
 /**
@@ -15,9 +15,9 @@ CREATE TABLE IF NOT EXISTS "projects_master" (
     "unit" TEXT,                      -- 班
     "project_group" TEXT,             -- 係
     "creator" TEXT,                   -- 作成責任者
-    "purpose" TEXT,                   -- 事業の目的
-    "current_issues" TEXT,            -- 現状・課題
-    "overview" TEXT,                  -- 事業の概要
+    "purpose_text_id" TEXT,           -- 事業の目的（texts.text_id）
+    "current_issues_text_id" TEXT,    -- 現状・課題（texts.text_id）
+    "overview_text_id" TEXT,          -- 事業の概要（texts.text_id）
     "overview_url" TEXT,              -- 事業概要URL
     "project_category" TEXT,          -- 事業区分
     "start_year" TEXT,                -- 事業開始年度
@@ -47,9 +47,9 @@ COMMENT ON COLUMN projects_master.section IS '室';
 COMMENT ON COLUMN projects_master.unit IS '班';
 COMMENT ON COLUMN projects_master.project_group IS '係';
 COMMENT ON COLUMN projects_master.creator IS '作成責任者';
-COMMENT ON COLUMN projects_master.purpose IS '事業の目的';
-COMMENT ON COLUMN projects_master.current_issues IS '現状・課題';
-COMMENT ON COLUMN projects_master.overview IS '事業の概要';
+COMMENT ON COLUMN projects_master.purpose_text_id IS '事業の目的（texts.text_id）';
+COMMENT ON COLUMN projects_master.current_issues_text_id IS '現状・課題（texts.text_id）';
+COMMENT ON COLUMN projects_master.overview_text_id IS '事業の概要（texts.text_id）';
 COMMENT ON COLUMN projects_master.overview_url IS '事業概要URL';
 COMMENT ON COLUMN projects_master.project_category IS '事業区分';
 COMMENT ON COLUMN projects_master.start_year IS '事業開始年度';
@@ -144,6 +144,29 @@ COMMENT ON COLUMN related_projects.related_project_id IS '関連事業の事業I
 COMMENT ON COLUMN related_projects.related_project_name IS '関連事業の事業名';
 COMMENT ON COLUMN related_projects.relation_type IS '関連性';
 
+CREATE TABLE IF NOT EXISTS "project_lineage" (
+    "project_year" BIGINT,            -- 事業年度
+    "project_id" TEXT,                -- 予算事業ID
+    "lineage_id" TEXT,                -- 系譜ID
+    "year_sequence" BIGINT,           -- 系譜内の年度の順番
+    "first_year" BIGINT,              -- 系譜の最初の事業年度
+    "last_year" BIGINT,               -- 系譜の最後の事業年度
+    "project_count" BIGINT,           -- 系譜に含まれる予算事業IDの数
+    "lineage_years" JSONB,            -- 系譜の事業年度の一覧
+    PRIMARY KEY ("project_year", "project_id")
+);
+
+COMMENT ON COLUMN project_lineage.project_year IS '事業年度';
+COMMENT ON COLUMN project_lineage.project_id IS '予算事業ID';
+COMMENT ON COLUMN project_lineage.lineage_id IS '系譜ID';
+COMMENT ON COLUMN project_lineage.year_sequence IS '系譜内の年度の順番';
+COMMENT ON COLUMN project_lineage.first_year IS '系譜の最初の事業年度';
+COMMENT ON COLUMN project_lineage.last_year IS '系譜の最後の事業年度';
+COMMENT ON COLUMN project_lineage.project_count IS '系譜に含まれる予算事業IDの数';
+COMMENT ON COLUMN project_lineage.lineage_years IS '系譜の事業年度の一覧';
+
+CREATE INDEX IF NOT EXISTS project_lineage_lineage_id_idx ON project_lineage (lineage_id, project_year);
+
 -- 予算・執行セクション
 
 CREATE TABLE IF NOT EXISTS "budgets" (
@@ -240,6 +263,46 @@ COMMENT ON COLUMN budget_items.budget_amount IS '予算額（歳出予算項目
 COMMENT ON COLUMN budget_items.next_year_request IS '翌年度要求額（歳出予算項目ごと）';
 COMMENT ON COLUMN budget_items.remarks IS '備考（歳出予算項目ごと）';
 
+CREATE TABLE IF NOT EXISTS "budget_cube" (
+    "cell_id" TEXT,                   -- 集計セルID
+    "grouping_id" BIGINT,             -- 集計の組み合わせ（全体にまとめた集計軸のビットが 1）
+    "project_year" BIGINT,            -- 事業年度
+    "budget_year" BIGINT,             -- 予算年度
+    "ministry" TEXT,                  -- 府省庁
+    "bureau" TEXT,                    -- 局・庁
+    "account_category" TEXT,          -- 会計区分
+    "budget_item" TEXT,               -- 項
+    "project_count" BIGINT,           -- 事業数
+    "initial_budget" NUMERIC,         -- 当初予算
+    "supplementary_budget" NUMERIC,   -- 補正予算（第1次〜第5次の合計）
+    "current_budget" NUMERIC,         -- 歳出予算現額
+    "execution_amount" NUMERIC,       -- 執行額
+    "execution_rate" DOUBLE PRECISION, -- 執行率（執行額 / 歳出予算現額）
+    "budget_amount" NUMERIC,          -- 予算額（歳出予算項目ごとの合計）
+    PRIMARY KEY ("cell_id")
+);
+
+COMMENT ON COLUMN budget_cube.cell_id IS '集計セルID';
+COMMENT ON COLUMN budget_cube.grouping_id IS '集計の組み合わせ（全体にまとめた集計軸のビットが 1）';
+COMMENT ON COLUMN budget_cube.project_year IS '事業年度';
+COMMENT ON COLUMN budget_cube.budget_year IS '予算年度';
+COMMENT ON COLUMN budget_cube.ministry IS '府省庁';
+COMMENT ON COLUMN budget_cube.bureau IS '局・庁';
+COMMENT ON COLUMN budget_cube.account_category IS '会計区分';
+COMMENT ON COLUMN budget_cube.budget_item IS '項';
+COMMENT ON COLUMN budget_cube.project_count IS '事業数';
+COMMENT ON COLUMN budget_cube.initial_budget IS '当初予算';
+COMMENT ON COLUMN budget_cube.supplementary_budget IS '補正予算（第1次〜第5次の合計）';
+COMMENT ON COLUMN budget_cube.current_budget IS '歳出予算現額';
+COMMENT ON COLUMN budget_cube.execution_amount IS '執行額';
+COMMENT ON COLUMN budget_cube.execution_rate IS '執行率（執行額 / 歳出予算現額）';
+COMMENT ON COLUMN budget_cube.budget_amount IS '予算額（歳出予算項目ごとの合計）';
+
+-- 集計軸の値（全体にまとめた軸は NULL）による 1 行参照用
+CREATE INDEX IF NOT EXISTS budget_cube_lookup_idx ON budget_cube (
+    grouping_id, project_year, budget_year, ministry, bureau, account_category, budget_item
+);
+
 -- 支出先セクション
 
 CREATE TABLE IF NOT EXISTS "expenditures" (
@@ -263,8 +326,9 @@ CREATE TABLE IF NOT EXISTS "expenditures" (
     "specific_contract_method" TEXT,      -- 具体的な契約方式等
     "num_bidders" TEXT,                   -- 入札者数
     "bid_rate" TEXT,                      -- 落札率
-    "sole_bid_reason" TEXT,               -- 一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）
+    "sole_bid_reason_text_id" TEXT,       -- 一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）（texts.text_id）
     "other_contract" TEXT,                -- その他の契約
+    "recipient_id" TEXT,                  -- 支出先ID（名寄せ）
     PRIMARY KEY ("project_year", "project_id", "seq_no")
 );
 
@@ -287,8 +351,26 @@ COMMENT ON COLUMN expenditures.contract_method IS '契約方式等';
 COMMENT ON COLUMN expenditures.specific_contract_method IS '具体的な契約方式等';
 COMMENT ON COLUMN expenditures.num_bidders IS '入札者数';
 COMMENT ON COLUMN expenditures.bid_rate IS '落札率';
-COMMENT ON COLUMN expenditures.sole_bid_reason IS '一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）';
+COMMENT ON COLUMN expenditures.sole_bid_reason_text_id IS '一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）（texts.text_id）';
 COMMENT ON COLUMN expenditures.other_contract IS 'その他の契約';
+COMMENT ON COLUMN expenditures.recipient_id IS '支出先ID（名寄せ）';
+
+CREATE TABLE IF NOT EXISTS "recipients" (
+    "recipient_id" TEXT,                  -- 支出先ID（名寄せ）
+    "canonical_name" TEXT,                -- 代表名称
+    "corporate_number" TEXT,              -- 法人番号
+    "name_variants" BIGINT,               -- 表記ゆれの数
+    "record_count" BIGINT,                -- 支出先レコード数
+    PRIMARY KEY ("recipient_id")
+);
+
+COMMENT ON COLUMN recipients.recipient_id IS '支出先ID（名寄せ）';
+COMMENT ON COLUMN recipients.canonical_name IS '代表名称';
+COMMENT ON COLUMN recipients.corporate_number IS '法人番号';
+COMMENT ON COLUMN recipients.name_variants IS '表記ゆれの数';
+COMMENT ON COLUMN recipients.record_count IS '支出先レコード数';
+
+CREATE INDEX IF NOT EXISTS expenditures_recipient_id_idx ON expenditures (recipient_id);
 
 CREATE TABLE IF NOT EXISTS "expenditure_flows" (
     "project_year" BIGINT,                -- 事業年度
@@ -358,7 +440,7 @@ CREATE TABLE IF NOT EXISTS "expenditure_contracts" (
     "specific_contract_method" TEXT,      -- 具体的な契約方式等（国庫債務負担行為等による契約）
     "num_bidders" TEXT,                   -- 入札者数（応募者数）（国庫債務負担行為等による契約）
     "bid_rate" TEXT,                      -- 落札率（％）（国庫債務負担行為等による契約）
-    "sole_bid_reason" TEXT,               -- 一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）（国庫債務負担行為等による契約）
+    "sole_bid_reason_text_id" TEXT,       -- 一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）（国庫債務負担行為等による契約）（texts.text_id）
     "other_contract_detail" TEXT,         -- その他の契約（国庫債務負担行為等による契約）
     PRIMARY KEY ("project_year", "project_id", "seq_no")
 );
@@ -377,13 +459,35 @@ COMMENT ON COLUMN expenditure_contracts.contract_method IS '契約方式等（
 COMMENT ON COLUMN expenditure_contracts.specific_contract_method IS '具体的な契約方式等（国庫債務負担行為等による契約）';
 COMMENT ON COLUMN expenditure_contracts.num_bidders IS '入札者数（応募者数）（国庫債務負担行為等による契約）';
 COMMENT ON COLUMN expenditure_contracts.bid_rate IS '落札率（％）（国庫債務負担行為等による契約）';
-COMMENT ON COLUMN expenditure_contracts.sole_bid_reason IS '一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）（国庫債務負担行為等による契約）';
+COMMENT ON COLUMN expenditure_contracts.sole_bid_reason_text_id IS '一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）（国庫債務負担行為等による契約）（texts.text_id）';
 COMMENT ON COLUMN expenditure_contracts.other_contract_detail IS 'その他の契約（国庫債務負担行為等による契約）';
 
+-- ============================================================
+-- 長文テキスト（重複排除済み）
+-- 事業の目的・現状・課題・事業の概要・一者応札の理由は texts に 1 度だけ格納し、
+-- 各テーブルの *_text_id カラムから参照する
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS "texts" (
+    "text_id" TEXT,                   -- テキストID（正規化後のテキストのハッシュ値）
+    "text" TEXT,                      -- テキスト
+    PRIMARY KEY ("text_id")
+);
+
+COMMENT ON TABLE texts IS '長文テキスト（build_database.py が重複排除して生成）';
+COMMENT ON COLUMN texts.text_id IS 'テキストID（正規化後のテキストのハッシュ値）';
+COMMENT ON COLUMN texts.text IS 'テキスト';
+
 -- ============================================================
 -- 外部キー制約
 -- ============================================================
 
+ALTER TABLE project_lineage
+ADD CONSTRAINT project_lineage_project_fkey
+FOREIGN KEY (project_year, project_id)
+REFERENCES projects_master(project_year, project_id)
+ON DELETE CASCADE;
+
 ALTER TABLE budgets
 ADD CONSTRAINT budgets_project_fkey
 FOREIGN KEY (project_year, project_id)
@@ -444,6 +548,49 @@ FOREIGN KEY (project_year, project_id)
 REFERENCES projects_master(project_year, project_id)
 ON DELETE CASCADE;
 
+-- ============================================================
+-- 全文検索インデックス（pg_trgm）
+-- ILIKE '%キーワード%' による部分一致検索を GIN インデックスで高速化する
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS projects_master_project_name_trgm_idx ON projects_master USING gin (project_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS texts_text_trgm_idx ON texts USING gin (text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS expenditures_contract_summary_trgm_idx ON expenditures USING gin (contract_summary gin_trgm_ops);
+
+-- ============================================================
+-- カタログ（テーブル・カラムの統計情報）
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS "catalog" (
+    "table_name" TEXT,                -- テーブル名
+    "column_name" TEXT,               -- カラム名
+    "ordinal_position" BIGINT,        -- カラム順序
+    "data_type" TEXT,                 -- SQL 型
+    "logical_name" TEXT,              -- 論理名
+    "row_count" BIGINT,               -- 行数
+    "null_rate" DOUBLE PRECISION,     -- NULL 率
+    "distinct_count" BIGINT,          -- 異なり数
+    "top_values" JSONB,               -- 最頻値（上位）
+    "min_value" NUMERIC,              -- 最小値（数値カラムのみ）
+    "max_value" NUMERIC,              -- 最大値（数値カラムのみ）
+    PRIMARY KEY ("table_name", "column_name")
+);
+
+COMMENT ON TABLE catalog IS 'テーブル・カラムの統計情報カタログ（build_database.py が生成）';
+COMMENT ON COLUMN catalog.table_name IS 'テーブル名';
+COMMENT ON COLUMN catalog.column_name IS 'カラム名';
+COMMENT ON COLUMN catalog.ordinal_position IS 'カラム順序';
+COMMENT ON COLUMN catalog.data_type IS 'SQL 型';
+COMMENT ON COLUMN catalog.logical_name IS '論理名';
+COMMENT ON COLUMN catalog.row_count IS '行数';
+COMMENT ON COLUMN catalog.null_rate IS 'NULL 率';
+COMMENT ON COLUMN catalog.distinct_count IS '異なり数';
+COMMENT ON COLUMN catalog.top_values IS '最頻値（上位）';
+COMMENT ON COLUMN catalog.min_value IS '最小値（数値カラムのみ）';
+COMMENT ON COLUMN catalog.max_value IS '最大値（数値カラムのみ）';
+
 -- SQL クエリを直接実行する関数
 CREATE OR REPLACE FUNCTION exec_sql(sql TEXT)
 RETURNS TABLE (
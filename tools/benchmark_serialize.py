@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+アップロード用シリアライズのベンチマーク
+
+構築済みテーブルのキャッシュ（tools/output/tables/）を読み込み、
+従来の df.to_dict('records') + json.dumps とカラム単位の orjson エンコードの
+CPU 時間・ピークメモリを比較する
+"""
+
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from build_database.serialize import iter_json_batches
+from build_database.upload import BATCH_SIZE
+
+# 定数
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TABLES_CACHE_DIR = PROJECT_ROOT / "tools" / "output" / "tables"
+
+# ロギング設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def serialize_records(df: pd.DataFrame) -> tuple[int, int]:
+    """従来方式: テーブル全体を辞書のリストに変換し、バッチごとに json.dumps"""
+    records = df.to_dict('records')
+    total_bytes = 0
+    invalid_batches = 0
+    for i in range(0, len(records), BATCH_SIZE):
+        payload = json.dumps(records[i:i + BATCH_SIZE]).encode("utf-8")
+        total_bytes += len(payload)
+        invalid_batches += b"NaN" in payload
+    return total_bytes, invalid_batches
+
+
+def serialize_columns(df: pd.DataFrame) -> tuple[int, int]:
+    """新方式: バッチごとにカラムの配列から orjson でエンコード"""
+    total_bytes = 0
+    invalid_batches = 0
+    for _, payload in iter_json_batches(df, BATCH_SIZE):
+        total_bytes += len(payload)
+        invalid_batches += b"NaN" in payload
+    return total_bytes, invalid_batches
+
+
+def measure(name: str, func: Callable[[pd.DataFrame], tuple[int, int]], df: pd.DataFrame) -> None:
+    """CPU 時間とピークメモリ（tracemalloc）を計測して出力"""
+    tracemalloc.start()
+    start = time.process_time()
+    total_bytes, invalid_batches = func(df)
+    cpu_seconds = time.process_time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    logger.info(
+        f"  {name:<24} CPU {cpu_seconds:7.2f} 秒, ピークメモリ {peak / 1024 / 1024:8.1f} MiB, "
+        f"出力 {total_bytes / 1024 / 1024:8.1f} MiB, NaN を含むバッチ {invalid_batches:,} 件"
+    )
+
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description="アップロード用シリアライズのベンチマーク")
+    parser.add_argument("--table", default="expenditures", help="対象テーブル（デフォルト: expenditures）")
+    args = parser.parse_args()
+
+    cache_path = TABLES_CACHE_DIR / f"{args.table}.pkl"
+    if not cache_path.exists():
+        logger.error(f"構築済みテーブルが見つかりません: {cache_path}（先に build_database.py を実行してください）")
+        return
+
+    df = pd.read_pickle(cache_path)
+    logger.info(f"{args.table}: {len(df):,} 行, {len(df.columns)} カラム, バッチサイズ {BATCH_SIZE:,}")
+
+    measure("to_dict + json.dumps", serialize_records, df)
+    measure("カラム単位 + orjson", serialize_columns, df)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,38 @@
 データベース構築スクリプト
 
 tools/input/ 配下の Zip ファイルを解凍して Supabase データベースにデータを登録する。
+--target duckdb:PATH / sqlite:PATH を指定した場合は組み込みデータベースファイルに書き出す。
+
+サブコマンドで段階ごとに実行することもできる（各段階は前の段階の出力を tools/ 配下から読み込む）。
+    extract   Zip ファイルを解凍する（tools/input/csv/ に出力）
+    build     CSV からテーブルを構築する（tools/output/tables/ に出力）
+    validate  構築済みテーブルを検証する（主キー重複・外部キーの参照切れ）
+    export    構築済みテーブルを DuckDB / SQLite ファイルに書き出す
+    load      構築済みテーブルを Supabase に登録する
+    all       全段階を実行する（サブコマンド省略時）
+    compare   直近の実行の処理速度を過去の実行と比較する
+各サブコマンドは必要なモジュール（pandas・supabase など）だけを実行時に読み込む。
+実行ごとに段階別の処理時間・行数・ピークメモリを tools/output/run_history.sqlite に記録する。
 """
 
+import argparse
 import logging
-import os
-import shutil
-import zipfile
+import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-from supabase import create_client, Client
-
-from build_database.basic_info import build_basic_info_tables
-from build_database.budget_execution import build_budget_execution_tables
-from build_database.expenditure import build_expenditure_tables
-
 # 定数
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 ZIP_DIR = PROJECT_ROOT / "tools" / "input"
 CSV_DIR = PROJECT_ROOT / "tools" / "input" / "csv"
 OUTPUT_DIR = PROJECT_ROOT / "tools" / "output"
+SCHEMA_INFO_PATH = PROJECT_ROOT / "src" / "data" / "schema-info.json"
+TABLES_CACHE_DIR = OUTPUT_DIR / "tables"
+CHECKPOINT_PATH = OUTPUT_DIR / "upload_checkpoint.json"
+RUN_HISTORY_PATH = OUTPUT_DIR / "run_history.sqlite"
+PROMETHEUS_TEXTFILE_DIR = OUTPUT_DIR / "metrics"
 
-# .env ファイルの読み込み
-load_dotenv(PROJECT_ROOT / ".env")
+# サブコマンド（省略時は all）
+COMMANDS = ("extract", "build", "validate", "export", "load", "all", "compare")
 
 # ロギング設定
 logging.basicConfig(
@@ -36,123 +45,420 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def extract_zip_files(zip_dir: Path, csv_dir: Path) -> None:
-    """指定された Zip ファイルを解凍して CSV ファイルを csv_dir に配置する"""
-    logger.info("Zip ファイルの解凍を開始")
+def connect_supabase():
+    """.env の接続情報で Supabase に接続（接続情報が未設定の場合は None）"""
+    import os
 
-    # csv_dir が存在する場合は削除して再作成
-    if csv_dir.exists():
-        shutil.rmtree(csv_dir)
-    csv_dir.mkdir(parents=True, exist_ok=True)
+    from dotenv import load_dotenv
+    from supabase import create_client
 
-    # 対象の Zip ファイル名を定義
-    target_zip_files = [
-        "1-1_RS_2024_基本情報_組織情報.zip",
-        "1-2_RS_2024_基本情報_事業概要等.zip",
-        "1-3_RS_2024_基本情報_政策・施策、法令等.zip",
-        "1-4_RS_2024_基本情報_補助率等.zip",
-        "1-5_RS_2024_基本情報_関連事業.zip",
-        "2-1_RS_2024_予算・執行_サマリ.zip",
-        "2-2_RS_2024_予算・執行_予算種別・歳出予算項目.zip",
-        "5-1_RS_2024_支出先_支出情報.zip",
-        "5-2_RS_2024_支出先_支出ブロックのつながり.zip",
-        "5-3_RS_2024_支出先_費目・使途.zip",
-        "5-4_RS_2024_支出先_国庫債務負担行為等による契約.zip"
-    ]
+    # .env ファイルの読み込み
+    load_dotenv(PROJECT_ROOT / ".env")
 
-    for zip_filename in target_zip_files:
-        zip_file = zip_dir / zip_filename
-        if not zip_file.exists():
-            raise FileNotFoundError(f"Zip ファイルが見つかりません: {zip_file}")
+    # Supabase 接続情報を取得
+    supabase_url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+    supabase_key = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 
-        logger.info(f"  解凍中: {zip_filename}")
+    if not supabase_url or not supabase_key:
+        logger.error("環境変数 NEXT_PUBLIC_SUPABASE_URL または NEXT_PUBLIC_SUPABASE_ANON_KEY が設定されていません")
+        return None
 
-        # 一時解凍ディレクトリ
-        temp_extract_dir = csv_dir / f"temp_{zip_file.stem}"
-        temp_extract_dir.mkdir(exist_ok=True)
+    supabase = create_client(supabase_url, supabase_key)
+    logger.info("Supabase に接続しました")
+    return supabase
 
-        # Zip ファイルを解凍
-        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-            zip_ref.extractall(temp_extract_dir)
 
-        # 解凍されたファイルから CSV ファイルを検索して移動
-        _move_csv_files_to_csv_dir(temp_extract_dir, csv_dir)
+def load_cache_manifest():
+    """前の段階（build）が保存したキャッシュのテーブル一覧・抽出割合を読み込む（キャッシュがない場合は None）"""
+    from build_database.cache import load_manifest
 
-        # 一時ディレクトリを削除
-        shutil.rmtree(temp_extract_dir)
+    try:
+        return load_manifest(TABLES_CACHE_DIR)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"{e}（先に build を実行してください）")
+        return None
 
-    logger.info(f"Zip ファイルの解凍が完了しました: {csv_dir}")
 
+def load_cached_tables(recorder):
+    """前の段階（build）が保存した構築済みテーブルを読み込む（キャッシュがない場合は None）"""
+    from build_database.cache import load_tables
 
-def _move_csv_files_to_csv_dir(source_dir: Path, target_dir: Path) -> None:
-    """再帰的に CSV ファイルを検索して target_dir 直下に移動する"""
-    for item in source_dir.rglob('*'):
-        if item.is_file() and item.suffix.lower() == '.csv':
-            # ファイル名が重複しないようにする（必要に応じて）
-            target_path = target_dir / item.name
-            if target_path.exists():
-                logger.warning(f"  CSV ファイル名が重複しています: {item.name} (上書きします)")
-            shutil.move(str(item), str(target_path))
-            logger.info(f"    CSV ファイル移動: {item.name}")
+    manifest = load_cache_manifest()
+    if manifest is None:
+        return None
 
+    sample_fraction = manifest["sample_fraction"]
+    if sample_fraction is None:
+        logger.info("キャッシュ済みのテーブルを読み込みます")
+    else:
+        logger.info(f"キャッシュ済みのテーブルを読み込みます（--sample {sample_fraction} で構築）")
+        # 実行履歴は全件の実行と区別して比較する
+        recorder.sample_fraction = sample_fraction
 
-def main():
-    """メイン処理"""
-    logger.info("=" * 60)
-    logger.info("データベース構築開始")
-    logger.info("=" * 60)
+    with recorder.stage("read_cache") as stage:
+        tables = load_tables(TABLES_CACHE_DIR)
+        stage.rows = _count_rows(tables)
+    return tables
 
-    # Supabase 接続情報を取得
-    supabase_url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-    supabase_key = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 
-    if not supabase_url or not supabase_key:
-        logger.error("環境変数 NEXT_PUBLIC_SUPABASE_URL または NEXT_PUBLIC_SUPABASE_ANON_KEY が設定されていません")
-        return
+def _count_rows(tables: dict) -> int:
+    """全テーブルの行数の合計"""
+    return sum(len(df) for df in tables.values())
 
-    supabase: Client = create_client(supabase_url, supabase_key)
-    logger.info("Supabase に接続しました")
 
-    # Zip ファイルの解凍
-    extract_zip_files(ZIP_DIR, CSV_DIR)
+def export_tables(tables: dict, engine: str, database_path: Path, recorder) -> None:
+    """全文検索インデックスを加えて組み込みデータベースファイルに書き出す"""
+    from build_database.embedded import write_embedded_database
+    from build_database.schema import load_table_definitions
+    from build_database.search import SEARCH_TABLE_DEFINITIONS, build_search_index
 
-    # 出力ディレクトリ作成
-    OUTPUT_DIR.mkdir(exist_ok=True)
+    with recorder.stage("export") as stage:
+        # 組み込みデータベースには全文検索インデックスも格納
+        tables.update(build_search_index(tables))
+        write_embedded_database(tables, {**load_table_definitions(), **SEARCH_TABLE_DEFINITIONS}, engine, database_path)
+        stage.rows = _count_rows(tables)
 
-    # 基本情報セクションのテーブルを構築
-    basic_info_tables = build_basic_info_tables(CSV_DIR)
 
-    # 予算・執行セクションのテーブルを構築
-    budget_execution_tables = build_budget_execution_tables(CSV_DIR)
+def extract(recorder) -> None:
+    """Zip ファイルを解凍"""
+    from build_database.extract import extract_zip_files
 
-    # 支出先セクションのテーブルを構築
-    expenditure_tables = build_expenditure_tables(CSV_DIR)
+    with recorder.stage("extract"):
+        extract_zip_files(ZIP_DIR, CSV_DIR)
 
-    # 全テーブルを統合
-    tables = {**basic_info_tables, **budget_execution_tables, **expenditure_tables}
 
-    # Supabase に書き込み
-    logger.info("\n" + "=" * 60)
-    logger.info("Supabase に書き込み")
-    logger.info("=" * 60)
+def run_extract(args: argparse.Namespace, recorder) -> int:
+    """extract: Zip ファイルを解凍"""
+    extract(recorder)
+    return 0
+
+
+def run_build(args: argparse.Namespace, recorder) -> int:
+    """build: 解凍済みの CSV から全テーブルを構築してキャッシュに保存"""
+    if not any(CSV_DIR.glob("*.csv")):
+        logger.error(f"CSV ファイルが見つかりません: {CSV_DIR}（先に extract を実行してください）")
+        return 1
+
+    from build_database.build import iter_tables
+
+    # 構築したテーブルは iter_tables がキャッシュに保存する（メモリ上には保持しない）
+    with recorder.stage("build") as stage:
+        tables = recorder.track_tables("build", iter_tables(CSV_DIR, TABLES_CACHE_DIR, OUTPUT_DIR, args.sample))
+        stage.rows = sum(len(df) for _, df in tables)
+    return 0
+
+
+def run_validate(args: argparse.Namespace, recorder) -> int:
+    """validate: 構築済みテーブルの主キー重複・外部キーの参照切れを検証"""
+    tables = load_cached_tables(recorder)
+    if tables is None:
+        return 1
+
+    from build_database.common import validate_tables
+    from build_database.schema import load_foreign_keys, load_table_definitions
+
+    with recorder.stage("validate") as stage:
+        problems = validate_tables(tables, load_table_definitions(), load_foreign_keys())
+        stage.rows = _count_rows(tables)
+    if problems > 0:
+        logger.error(f"検証で問題が見つかりました: {problems:,} 行")
+        return 1
 
-    for table_name, df in tables.items():
-        logger.info(f"  {table_name} テーブル書き込み中... ({len(df):,} 行)")
-        records = df.to_dict('records')
+    logger.info("検証で問題は見つかりませんでした")
+    return 0
 
-        # バッチサイズを指定して分割アップロード
-        batch_size = 1000
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            supabase.table(table_name).upsert(batch).execute()  # type: ignore
 
-        logger.info(f"  {table_name} テーブル書き込み完了")
+def run_export(args: argparse.Namespace, recorder) -> int:
+    """export: 構築済みテーブルを DuckDB / SQLite ファイルに書き出す"""
+    from build_database.embedded import parse_target
+
+    engine, database_path = parse_target(args.target)
+    if engine == "supabase":
+        logger.error("export の出力先には duckdb:PATH / sqlite:PATH を指定してください（Supabase へは load を使用）")
+        return 1
+
+    tables = load_cached_tables(recorder)
+    if tables is None:
+        return 1
+
+    export_tables(tables, engine, database_path, recorder)
+    return 0
+
+
+def run_load(args: argparse.Namespace, recorder) -> int:
+    """load: 構築済みテーブルを Supabase に登録（--resume の場合は中断したアップロードを再開）"""
+    manifest = load_cache_manifest()
+    if manifest is None:
+        return 1
+
+    # サンプリングしたキャッシュは明示的に指定した場合のみ登録する（一部の事業のみのデータで上書きしない）
+    sample_fraction = manifest["sample_fraction"]
+    if sample_fraction is not None and not getattr(args, "allow_sample", False):
+        logger.error(
+            f"構築済みテーブルのキャッシュは事業の一部（--sample {sample_fraction}）から構築されています"
+            "（全件で build を実行するか、一部のデータを登録する場合は --allow-sample を指定してください）"
+        )
+        return 1
+
+    supabase = connect_supabase()
+    if supabase is None:
+        return 1
 
+    tables = load_cached_tables(recorder)
+    if tables is None:
+        return 1
+
+    from build_database.catalog import CATALOG_TABLE, write_schema_info
+    from build_database.schema import load_table_definitions
+    from build_database.upload import upload_tables
+
+    if sample_fraction is None:
+        write_schema_info(tables[CATALOG_TABLE], load_table_definitions(), SCHEMA_INFO_PATH)
+    else:
+        # Web アプリが参照するスキーマ情報 JSON はサンプリング時は更新しない
+        logger.info(f"事業の一部から構築したキャッシュのため {SCHEMA_INFO_PATH.name} は更新しません")
+    with recorder.stage("load") as stage:
+        # 再開時は書き込み済みのバッチを除いた、今回送信した行数を記録
+        stage.rows = upload_tables(supabase, tables, CHECKPOINT_PATH, resume=args.resume)
+    return 0
+
+
+def run_all(args: argparse.Namespace, recorder) -> int:
+    """all: 解凍・構築・登録（または書き出し）を一括で実行"""
+    from build_database.embedded import parse_target
+
+    engine, database_path = parse_target(args.target)
+
+    if engine == "supabase" and args.resume:
+        # 前回構築したテーブルを再利用し、中断したアップロードを再開
+        return run_load(args, recorder)
+
+    if engine == "supabase":
+        supabase = connect_supabase()
+        if supabase is None:
+            return 1
+
+        from build_database.build import iter_tables
+        from build_database.catalog import CATALOG_TABLE, write_schema_info
+        from build_database.pipeline import run_pipeline
+        from build_database.schema import load_table_definitions
+        from build_database.upload import upload_table
+
+        # Zip ファイルの解凍
+        extract(recorder)
+
+        # テーブル構築とアップロードを並行に実行（構築済みのテーブルから順に書き込む）
+        logger.info("テーブル構築と Supabase への書き込みを並行に実行します")
+        definitions = load_table_definitions()
+        checkpoint = {}
+
+        def upload(item: tuple) -> None:
+            table_name, df = item
+            if table_name == CATALOG_TABLE and args.sample is None:
+                # Web アプリが参照するスキーマ情報 JSON は Supabase 投入時のみ更新（サンプリング時は更新しない）
+                write_schema_info(df, definitions, SCHEMA_INFO_PATH)
+            with recorder.stage(f"load/{table_name}") as stage:
+                stage.rows = upload_table(supabase, table_name, df, checkpoint, CHECKPOINT_PATH)
+
+        tables = recorder.track_tables("build", iter_tables(CSV_DIR, TABLES_CACHE_DIR, OUTPUT_DIR, args.sample))
+        run_pipeline(tables, upload)
+        logger.info("全テーブルの書き込みが完了しました")
+
+        # 構築とアップロードは並行に進むため、それぞれテーブル単位の処理時間を合算して記録
+        recorder.aggregate("build")
+        recorder.aggregate("load")
+        return 0
+
+    if args.resume:
+        tables = load_cached_tables(recorder)
+        if tables is None:
+            return 1
+    else:
+        from build_database.build import iter_tables
+
+        extract(recorder)
+        with recorder.stage("build") as stage:
+            tables = dict(recorder.track_tables(
+                "build", iter_tables(CSV_DIR, TABLES_CACHE_DIR, OUTPUT_DIR, args.sample)
+            ))
+            stage.rows = _count_rows(tables)
+
+    export_tables(tables, engine, database_path, recorder)
+    return 0
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    """compare: 実行の段階ごとの処理速度を過去の実行（移動中央値）と比較"""
+    from build_database.metrics import compare_run, log_comparisons
+
+    run_id, comparisons = compare_run(RUN_HISTORY_PATH, args.run, args.window, args.threshold)
+    if run_id is None:
+        logger.error(f"比較する実行が実行履歴にありません: {RUN_HISTORY_PATH}")
+        return 1
+
+    log_comparisons(run_id, comparisons)
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+def record_run(recorder, status: str) -> None:
+    """実行の段階別メトリクスを実行履歴・Prometheus の textfile に出力し、過去の実行と比較"""
+    import sqlite3
+
+    from build_database.metrics import compare_run, log_comparisons, write_prometheus_textfile
+
+    try:
+        run_id = recorder.save(RUN_HISTORY_PATH, status)
+        comparisons = []
+        if status == "success":
+            # 過去の実行と比較して処理速度の低下を検出（低下しても終了ステータスは変えない）
+            comparisons = compare_run(RUN_HISTORY_PATH, run_id)[1]
+            log_comparisons(run_id, comparisons)
+        # サブコマンドごとに別ファイル（他のサブコマンドの直近の実行のメトリクスを上書きしない）
+        textfile_path = PROMETHEUS_TEXTFILE_DIR / f"build_database_{recorder.command}.prom"
+        write_prometheus_textfile(recorder, status, comparisons, textfile_path)
+    except (OSError, sqlite3.Error) as e:
+        # メトリクスの記録に失敗しても本処理の結果は変えない
+        logger.warning(f"実行メトリクスの記録に失敗しました: {e}")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """
+    コマンドライン引数を解析
+
+    サブコマンドを省略した場合（従来の `build_database.py [--target ...] [--resume] [--sample ...]`）は all として扱う
+    """
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["all", *argv]
+
+    # 実行履歴の比較は標準ライブラリのみで動作する（pandas などは読み込まない）
+    from build_database.metrics import BASELINE_WINDOW, REGRESSION_THRESHOLD
+
+    parser = argparse.ArgumentParser(description="RS システムの CSV からデータベースを構築する")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    sample = argparse.ArgumentParser(add_help=False)
+    sample.add_argument(
+        "--sample",
+        type=_sample_fraction,
+        metavar="FRACTION",
+        help="事業年度・予算事業ID のハッシュ値で事業の一部（0 < FRACTION <= 1）を抽出して構築する（開発用）"
+    )
+
+    subparsers.add_parser("extract", help="Zip ファイルを解凍する").set_defaults(handler=run_extract)
+    subparsers.add_parser(
+        "build", parents=[sample], help="CSV からテーブルを構築してキャッシュに保存する"
+    ).set_defaults(handler=run_build)
+    subparsers.add_parser(
+        "validate", help="構築済みテーブルの主キー重複・外部キーの参照切れを検証する"
+    ).set_defaults(handler=run_validate)
+
+    export = subparsers.add_parser("export", help="構築済みテーブルを DuckDB / SQLite ファイルに書き出す")
+    export.add_argument("--target", type=_target, required=True, help="出力先（duckdb:PATH / sqlite:PATH）")
+    export.set_defaults(handler=run_export)
+
+    load = subparsers.add_parser("load", help="構築済みテーブルを Supabase に登録する")
+    load.add_argument("--resume", action="store_true", help="中断したアップロードを再開する")
+    load.add_argument(
+        "--allow-sample",
+        action="store_true",
+        help="--sample で構築したキャッシュ（事業の一部）の登録を許可する（schema-info.json は更新しない）"
+    )
+    load.set_defaults(handler=run_load)
+
+    run = subparsers.add_parser("all", parents=[sample], help="解凍・構築・登録を一括で実行する（省略時）")
+    run.add_argument(
+        "--target",
+        type=_target,
+        default="supabase",
+        help="出力先（supabase / duckdb:PATH / sqlite:PATH）。デフォルト: supabase"
+    )
+    run.add_argument(
+        "--resume",
+        action="store_true",
+        help="解凍・構築を行わずキャッシュ済みのテーブルを読み込み、中断したアップロードを再開する"
+    )
+    run.add_argument(
+        "--allow-sample",
+        action="store_true",
+        help="--sample で構築した事業の一部のデータの Supabase への登録を許可する（schema-info.json は更新しない）"
+    )
+    run.set_defaults(handler=run_all)
+
+    compare = subparsers.add_parser("compare", help="直近の実行の処理速度を過去の実行と比較する")
+    compare.add_argument("--run", type=int, metavar="RUN_ID", help="比較する実行（省略時は最新の実行）")
+    compare.add_argument(
+        "--window",
+        type=int,
+        default=BASELINE_WINDOW,
+        help=f"基準とする過去の実行数。デフォルト: {BASELINE_WINDOW}"
+    )
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help=f"処理速度の低下とみなす割合（0.2 は 20%% 低下）。デフォルト: {REGRESSION_THRESHOLD}"
+    )
+    compare.set_defaults(handler=run_compare)
+
+    args = parser.parse_args(argv)
+    if args.command == "all" and args.resume and args.sample is not None:
+        run.error("--resume と --sample は同時に指定できません")
+    if args.command == "all" and args.target == "supabase" and args.sample is not None and not args.allow_sample:
+        # 事業の一部のみから構築したテーブルで Supabase のデータを上書きしない
+        run.error("--sample で構築したデータを Supabase に登録する場合は --allow-sample を指定してください")
+    return args
+
+
+def _sample_fraction(value: str) -> float:
+    """--sample の値を検証"""
+    fraction = float(value)
+    if not 0 < fraction <= 1:
+        raise argparse.ArgumentTypeError(f"0 より大きく 1 以下の値を指定してください: {value}")
+    return fraction
+
+
+def _target(value: str) -> str:
+    """--target の値を検証"""
+    from build_database.embedded import parse_target
+
+    try:
+        parse_target(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def main(argv: list[str]) -> int:
+    """メイン処理"""
+    args = parse_args(argv)
+    if args.command == "compare":
+        # 比較のみの実行は実行履歴に記録しない
+        return run_compare(args)
+
+    logger.info("=" * 60)
+    logger.info(f"データベース構築開始（{args.command}）")
     logger.info("=" * 60)
-    logger.info("完了")
+
+    # 出力ディレクトリ作成
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    from build_database.metrics import RunRecorder
+
+    arguments = {key: value for key, value in vars(args).items() if key not in ("command", "handler")}
+    recorder = RunRecorder(args.command, arguments, getattr(args, "sample", None))
+    result = "error"
+    try:
+        status = args.handler(args, recorder)
+        result = "success" if status == 0 else "failed"
+    finally:
+        # 例外で中断した場合も実行履歴に記録する
+        record_run(recorder, result)
+
     logger.info("=" * 60)
+    logger.info("完了" if status == 0 else "失敗")
     logger.info("=" * 60)
+    return status
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,195 @@
+"""
+予算キューブ生成モジュール
+
+budgets・budget_items を事業年度 × 予算年度 × 府省庁 × 局・庁 × 会計区分 × 項 の
+GROUPING SETS で事前集計し、budget_cube テーブルを構築する
+ダッシュボードの予算の内訳・ドリルダウンを TEXT 型の金額のキャストと再集計なしに
+1 行の参照で取得できるようにする
+"""
+
+import hashlib
+import logging
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# budget_cube テーブルのテーブル名
+BUDGET_CUBE_TABLE = "budget_cube"
+
+# 集計軸（grouping_id のビット位置の順）
+DIMENSIONS = ["project_year", "budget_year", "ministry", "bureau", "account_category", "budget_item"]
+
+# 集計の組み合わせ
+# 局・庁は府省庁の下位階層のため、府省庁なしで局・庁だけを集計軸にする組み合わせは作らない
+GROUPING_SETS = [
+    [dimension for dimension in [*years, *organization, *account, *item] if dimension]
+    for years, organization, account, item in product(
+        [(), ("project_year",), ("budget_year",), ("project_year", "budget_year")],
+        [(), ("ministry",), ("ministry", "bureau")],
+        [(), ("account_category",)],
+        [(), ("budget_item",)],
+    )
+]
+
+# 補正予算のカラム
+SUPPLEMENTARY_COLUMNS = [f"supplementary_budget_{i}" for i in range(1, 6)]
+
+# budgets 由来の集計値（項を集計軸に含む組み合わせでは NULL）
+BUDGET_MEASURES = ["initial_budget", "supplementary_budget", "current_budget", "execution_amount"]
+
+# budget_items 由来の集計値
+ITEM_MEASURES = ["budget_amount"]
+
+
+def _to_amount(series: pd.Series) -> pd.Series:
+    """TEXT 型の金額を数値に変換（桁区切りのカンマを除去、数値以外は NaN）"""
+    return pd.to_numeric(series.astype("string").str.replace(",", "", regex=False), errors="coerce")
+
+
+def grouping_id(dimensions: list[str]) -> int:
+    """集計の組み合わせの ID（SQL の GROUPING() と同様に、集計済み = 全体にまとめた軸のビットが 1）"""
+    return sum(1 << i for i, dimension in enumerate(DIMENSIONS) if dimension not in dimensions)
+
+
+def _budget_facts(budgets: pd.DataFrame, organizations: pd.DataFrame) -> pd.DataFrame:
+    """budgets から集計用の明細（金額は数値化済み）を作成"""
+    facts = budgets[["project_year", "project_id", "budget_year", "account_category"]].copy()
+    facts["initial_budget"] = _to_amount(budgets["initial_budget"])
+    facts["supplementary_budget"] = sum(_to_amount(budgets[column]).fillna(0) for column in SUPPLEMENTARY_COLUMNS)
+    facts["current_budget"] = _to_amount(budgets["current_budget"])
+    facts["execution_amount"] = _to_amount(budgets["execution_amount"])
+    facts = facts.drop(index=_total_rows(facts, budgets["account"].notna()))
+    return facts.merge(organizations, on=["project_year", "project_id"], how="left")
+
+
+def _total_rows(facts: pd.DataFrame, has_account: pd.Series) -> pd.Index:
+    """
+    会計ごとの行の合計行（二重計上を防ぐため集計から除外する行）を特定
+
+    同じ事業・予算年度に会計の記載がある行がある場合に、会計の記載がない行のうち
+    金額（当初予算・補正予算・歳出予算現額・執行額）が会計の記載がある行の合計と一致する行を合計行とみなす
+    会計の記載がない行のみの事業・予算年度、合計と一致しない行は明細として集計する
+
+    Args:
+        facts: 集計用の明細（金額は数値化済み）
+        has_account: 会計の記載がある行
+
+    Returns:
+        合計行のインデックス
+    """
+    keys = ["project_year", "project_id", "budget_year"]
+    sums = facts[has_account].groupby(keys)[BUDGET_MEASURES].sum()
+    candidates = facts.loc[~has_account, [*keys, *BUDGET_MEASURES]].join(sums, on=keys, rsuffix="_sum", how="inner")
+    matched = np.logical_and.reduce([
+        np.isclose(candidates[measure].fillna(0), candidates[f"{measure}_sum"]) for measure in BUDGET_MEASURES
+    ])
+    totals = candidates.index[matched]
+
+    logger.info(f"  合計行（会計の記載がなく、会計ごとの行の合計と一致する行）を除外: {len(totals):,} 行")
+    if (~has_account).sum() > len(candidates):
+        logger.info(f"  会計の記載がない行のみの事業・予算年度の行を明細として集計: {(~has_account).sum() - len(candidates):,} 行")
+    if len(totals) < len(candidates):
+        logger.warning(
+            f"  会計の記載がない行のうち会計ごとの行の合計と一致しない行を明細として集計: {len(candidates) - len(totals):,} 行"
+        )
+    return totals
+
+
+def _item_facts(budget_items: pd.DataFrame, organizations: pd.DataFrame) -> pd.DataFrame:
+    """budget_items から集計用の明細（金額は数値化済み）を作成"""
+    facts = budget_items[["project_year", "project_id", "budget_year", "account_category", "budget_item"]].copy()
+    facts["budget_amount"] = _to_amount(budget_items["budget_amount"])
+    return facts.merge(organizations, on=["project_year", "project_id"], how="left")
+
+
+def _aggregate(facts: pd.DataFrame, dimensions: list[str], measures: list[str]) -> pd.DataFrame:
+    """1 つの集計の組み合わせで集計（事業数 + 金額の合計）"""
+    if dimensions:
+        grouped = facts.groupby(dimensions, dropna=False, sort=False)
+        result = grouped[measures].sum(min_count=1)
+        result["project_count"] = (
+            facts.drop_duplicates([*dimensions, "project_year", "project_id"])
+            .groupby(dimensions, dropna=False, sort=False).size()
+        )
+        return result.reset_index()
+
+    result = facts[measures].sum(min_count=1).to_frame().T
+    result["project_count"] = len(facts.drop_duplicates(["project_year", "project_id"]))
+    return result
+
+
+def _cell_id(cube: pd.DataFrame) -> pd.Series:
+    """集計行の ID（grouping_id + 集計軸の値のハッシュ）"""
+    keys = cube["grouping_id"].astype(str)
+    for dimension in DIMENSIONS:
+        keys = keys + "\x1f" + cube[dimension].astype("string").fillna("\x00")
+    return keys.map(lambda key: hashlib.sha1(key.encode("utf-8")).hexdigest()[:20])
+
+
+def build_budget_cube(projects_master: pd.DataFrame, budgets: pd.DataFrame, budget_items: pd.DataFrame) -> pd.DataFrame:
+    """
+    budget_cube テーブルを構築
+
+    項を集計軸に含む組み合わせは budget_items の予算額（項ごと）のみを集計し、
+    それ以外の組み合わせは budgets の当初予算・補正予算・歳出予算現額・執行額も集計する
+
+    Args:
+        projects_master: projects_master テーブル（府省庁・局・庁の参照用）
+        budgets: budgets テーブル
+        budget_items: budget_items テーブル
+
+    Returns:
+        budget_cube テーブルの DataFrame（1 行 = 1 集計セル）
+    """
+    logger.info(f"{BUDGET_CUBE_TABLE} テーブル構築中... ({len(GROUPING_SETS)} 通りの集計)")
+
+    organizations = projects_master[["project_year", "project_id", "ministry", "bureau"]].drop_duplicates(
+        ["project_year", "project_id"]
+    )
+    budget_facts = _budget_facts(budgets, organizations)
+    item_facts = _item_facts(budget_items, organizations)
+
+    frames = []
+    for dimensions in GROUPING_SETS:
+        if "budget_item" in dimensions:
+            cells = _aggregate(item_facts, dimensions, ITEM_MEASURES)
+        else:
+            budget_cells = _aggregate(budget_facts, dimensions, BUDGET_MEASURES)
+            item_cells = _aggregate(item_facts, dimensions, ITEM_MEASURES).drop(columns="project_count")
+            if dimensions:
+                cells = budget_cells.merge(item_cells, on=dimensions, how="outer")
+            else:
+                cells = pd.concat([budget_cells, item_cells], axis=1)
+            cells["project_count"] = cells["project_count"].fillna(0)
+
+        cells["grouping_id"] = grouping_id(dimensions)
+        frames.append(cells)
+
+    cube = pd.concat(frames, ignore_index=True)
+    for dimension in DIMENSIONS:
+        if dimension not in cube.columns:
+            cube[dimension] = None
+    for measure in BUDGET_MEASURES + ITEM_MEASURES:
+        if measure not in cube.columns:
+            cube[measure] = np.nan
+
+    # 執行率 = 執行額 / 歳出予算現額
+    current_budget = cube["current_budget"].where(cube["current_budget"] != 0)
+    cube["execution_rate"] = (cube["execution_amount"] / current_budget).round(4)
+
+    cube["project_year"] = cube["project_year"].astype("Int64")
+    cube["budget_year"] = cube["budget_year"].astype("Int64")
+    cube["project_count"] = cube["project_count"].astype("Int64")
+    cube["cell_id"] = _cell_id(cube)
+
+    result = cube[[
+        "cell_id", "grouping_id", *DIMENSIONS, "project_count",
+        *BUDGET_MEASURES, "execution_rate", *ITEM_MEASURES,
+    ]]
+
+    logger.info(f"  {BUDGET_CUBE_TABLE} テーブル完成: {len(result):,} 行")
+
+    return result
@@ -0,0 +1,113 @@
+"""
+テーブル構築モジュール
+
+解凍済みの CSV から全テーブル（事業の系譜・予算キューブ・名寄せ・長文・カタログを含む）を
+外部キーの参照順に構築し、構築したテーブルから順にキャッシュ（tools/output/tables/）へ保存する
+"""
+
+import logging
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pandas as pd
+
+from .budget_cube import BUDGET_CUBE_TABLE, build_budget_cube
+from .cache import MANIFEST_FILENAME, save_manifest, save_table
+from .catalog import CATALOG_TABLE, build_catalog_table, profile_table
+from .common import iter_spec_tables
+from .lineage import LINEAGE_TABLE, build_project_lineage
+from .recipients import resolve_recipients
+from .schema import load_table_definitions
+from .spec import SECTIONS
+from .texts import TEXTS_TABLE, TextStore
+
+logger = logging.getLogger(__name__)
+
+# 支出先の名寄せのレポート（output_dir 配下）
+RECIPIENT_CLUSTERS_FILENAME = "recipient_clusters.csv"
+
+# 長文のテキストID のキャッシュ（output_dir 配下）
+TEXT_CACHE_FILENAME = "text_cache.pkl"
+
+
+def iter_tables(
+    csv_dir: Path, cache_dir: Path, output_dir: Path, sample_fraction: Optional[float] = None
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    CSV から全テーブル（名寄せ・カタログを含む）を外部キーの参照順に 1 つずつ構築
+
+    構築したテーブルは順にキャッシュへ保存し、統計情報を集計して最後に catalog テーブルを返す
+    長文カラムは全セクションで共通のテキストID に置き換え、texts テーブルを catalog の直前に返す
+    sample_fraction を指定した場合は、抽出対象の事業のみで全テーブルを構築する
+
+    Args:
+        csv_dir: 解凍済みの CSV ファイルが格納されているディレクトリ
+        cache_dir: 構築済みテーブルのキャッシュディレクトリ
+        output_dir: 名寄せのレポート・長文のキャッシュの出力先
+        sample_fraction: 抽出する事業の割合（None の場合は全件）
+
+    Yields:
+        (テーブル名, DataFrame)
+    """
+    # 前回のキャッシュと混在しないよう、全テーブルの構築完了までテーブル一覧を消しておく
+    (cache_dir / MANIFEST_FILENAME).unlink(missing_ok=True)
+
+    definitions = load_table_definitions()
+    catalog_rows = []
+    table_names = []
+
+    def finish(table_name: str, df: pd.DataFrame) -> tuple[str, pd.DataFrame]:
+        if table_name != CATALOG_TABLE:
+            catalog_rows.extend(profile_table(df, definitions[table_name]))
+        save_table(df, table_name, cache_dir)
+        table_names.append(table_name)
+        return table_name, df
+
+    # 長文カラムのテキストID の対応（前回までの実行で処理済みの原文はサニタイズ・正規化を省略）
+    text_store = TextStore(output_dir / TEXT_CACHE_FILENAME)
+
+    # 基本情報・予算・執行・支出先の各セクション（spec.py の定義順）
+    sections = _iter_sections(csv_dir, sample_fraction, text_store)
+    # 事業の系譜・予算キューブの構築に使うテーブル
+    sources = {}
+
+    for table_name, df in sections:
+        if table_name in ("projects_master", "budgets"):
+            sources[table_name] = df
+
+        if table_name == "related_projects":
+            yield finish(table_name, df)
+            # 事業の系譜（年度をまたいだ同一事業）を解決
+            yield finish(LINEAGE_TABLE, build_project_lineage(sources["projects_master"], df))
+        elif table_name == "budget_items":
+            yield finish(table_name, df)
+            # 予算・執行のキューブ（府省庁・局・庁・会計区分・項別の事前集計）を構築
+            cube = build_budget_cube(sources.pop("projects_master"), sources.pop("budgets"), df)
+            yield finish(BUDGET_CUBE_TABLE, cube)
+        elif table_name == "expenditures":
+            # 支出先の名寄せ（expenditures に支出先IDを付与し recipients テーブルを構築）
+            df, recipients = resolve_recipients(df, output_dir / RECIPIENT_CLUSTERS_FILENAME)
+            yield finish(table_name, df)
+            yield finish("recipients", recipients)
+        else:
+            yield finish(table_name, df)
+
+    # 長文（重複排除済み）を texts テーブルに出力
+    yield finish(TEXTS_TABLE, text_store.to_table())
+    text_store.save()
+
+    # カタログ（統計情報）を catalog テーブルに出力
+    yield finish(CATALOG_TABLE, build_catalog_table(catalog_rows, definitions))
+    save_manifest(table_names, cache_dir, sample_fraction)
+
+
+def _iter_sections(
+    csv_dir: Path, sample_fraction: Optional[float], text_store: TextStore
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """spec.py のセクションごとに CSV 由来のテーブルを構築し、構築・検証できたテーブルから順に返す"""
+    for section_name, specs in SECTIONS:
+        logger.info("=" * 60)
+        logger.info(section_name)
+        logger.info("=" * 60)
+
+        yield from iter_spec_tables(specs, csv_dir, sample_fraction, text_store)
@@ -0,0 +1,88 @@
+"""
+構築済みテーブルのキャッシュモジュール
+
+構築したテーブルを tools/output/tables/ に保存し、後続の段階（検証・書き出し・アップロード）や
+--resume で再利用する
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 構築済みテーブルのキャッシュのテーブル一覧ファイル名
+MANIFEST_FILENAME = "manifest.json"
+
+
+def save_tables(tables: dict[str, pd.DataFrame], cache_dir: Path, sample_fraction: Optional[float] = None) -> None:
+    """
+    構築済みテーブルをキャッシュに保存（--resume で再利用）
+
+    Args:
+        tables: テーブル名をキー、DataFrame を値とする辞書
+        cache_dir: キャッシュディレクトリ
+        sample_fraction: 構築時に抽出した事業の割合（全件の場合は None）
+    """
+    for table_name, df in tables.items():
+        save_table(df, table_name, cache_dir)
+    save_manifest(list(tables), cache_dir, sample_fraction)
+
+
+def save_table(df: pd.DataFrame, table_name: str, cache_dir: Path) -> None:
+    """構築済みテーブルを 1 つキャッシュに保存"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(cache_dir / f"{table_name}.pkl")
+
+
+def save_manifest(table_names: list[str], cache_dir: Path, sample_fraction: Optional[float] = None) -> None:
+    """
+    キャッシュのテーブル一覧（テーブルの順序 = 外部キーの参照順を保持）と構築時の抽出割合を保存
+
+    抽出割合は、サンプリングしたキャッシュを後続の段階で全件のデータとして扱わないために記録する
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {"tables": table_names, "sample_fraction": sample_fraction}
+    (cache_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    logger.info(f"構築済みテーブルを保存しました: {cache_dir}")
+
+
+def load_manifest(cache_dir: Path) -> dict:
+    """
+    キャッシュのテーブル一覧と構築時の抽出割合を読み込む
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+
+    Returns:
+        {"tables": テーブル名のリスト, "sample_fraction": 抽出割合（全件の場合は None）}
+    """
+    manifest = cache_dir / MANIFEST_FILENAME
+    if not manifest.exists():
+        raise FileNotFoundError(f"構築済みテーブルのキャッシュが見つかりません: {cache_dir}")
+
+    content = json.loads(manifest.read_text(encoding="utf-8"))
+    if not isinstance(content, dict):
+        # 抽出割合を記録していない形式のキャッシュは全件かどうか判別できない
+        raise ValueError(f"構築済みテーブルのキャッシュの形式が古いため再構築してください: {cache_dir}")
+    return content
+
+
+def load_tables(cache_dir: Path) -> dict[str, pd.DataFrame]:
+    """
+    キャッシュから構築済みテーブルを読み込む
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+
+    Returns:
+        テーブル名をキー、DataFrame を値とする辞書（保存時の順序）
+    """
+    tables = {}
+    for table_name in load_manifest(cache_dir)["tables"]:
+        tables[table_name] = pd.read_pickle(cache_dir / f"{table_name}.pkl")
+        logger.info(f"  キャッシュ読み込み: {table_name} ({len(tables[table_name]):,} 行)")
+    return tables
@@ -0,0 +1,165 @@
+"""
+カタログ生成モジュール
+
+構築済みテーブルからカラムごとの統計情報（行数・NULL 率・異なり数・最頻値・最小/最大値）を算出し、
+catalog テーブルと src/data/schema-info.json を生成する
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .schema import TableDefinition
+
+logger = logging.getLogger(__name__)
+
+# catalog テーブル自身のテーブル名
+CATALOG_TABLE = "catalog"
+
+# 最頻値として保持する件数
+TOP_VALUES_LIMIT = 5
+
+# 最頻値の文字列を切り詰める長さ（AI プロンプトの肥大化防止）
+TOP_VALUE_MAX_LENGTH = 50
+
+
+def _to_python(value):
+    """numpy / pandas のスカラー値を JSON 化可能な Python 値に変換"""
+    if pd.isna(value):
+        return None
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _top_values(series: pd.Series) -> list[dict]:
+    """最頻値（上位 TOP_VALUES_LIMIT 件）を取得"""
+    counts = series.value_counts(dropna=True).head(TOP_VALUES_LIMIT)
+
+    top_values = []
+    for value, count in counts.items():
+        value = _to_python(value)
+        if isinstance(value, str) and len(value) > TOP_VALUE_MAX_LENGTH:
+            value = value[:TOP_VALUE_MAX_LENGTH] + "…"
+        top_values.append({"value": value, "count": int(count)})
+    return top_values
+
+
+def profile_table(df: pd.DataFrame, definition: TableDefinition) -> list[dict]:
+    """
+    テーブルのカラムごとの統計情報を算出
+
+    Args:
+        df: 対象 DataFrame
+        definition: テーブル定義
+
+    Returns:
+        catalog テーブルの行（カラムごとの辞書）のリスト
+    """
+    logger.info(f"統計情報算出: {definition.name} ({len(df):,} 行)")
+
+    row_count = len(df)
+
+    rows = []
+    for position, column in enumerate(definition.columns, start=1):
+        series = df[column.name] if column.name in df.columns else pd.Series([], dtype=object)
+        if column.data_type == "JSONB":
+            # リスト・辞書はハッシュ化できないため JSON 文字列として集計
+            series = series.map(lambda value: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value)
+
+        null_count = int(series.isna().sum()) + (row_count - len(series))
+        min_value: Optional[float] = None
+        max_value: Optional[float] = None
+        if column.is_numeric and row_count > 0:
+            numeric = pd.to_numeric(series, errors="coerce")
+            min_value = _to_python(numeric.min())
+            max_value = _to_python(numeric.max())
+
+        rows.append({
+            "table_name": definition.name,
+            "column_name": column.name,
+            "ordinal_position": position,
+            "data_type": column.data_type,
+            "logical_name": column.logical_name,
+            "row_count": row_count,
+            "null_rate": round(null_count / row_count, 4) if row_count > 0 else None,
+            "distinct_count": int(series.nunique(dropna=True)),
+            "top_values": _top_values(series),
+            "min_value": min_value,
+            "max_value": max_value,
+        })
+
+    return rows
+
+
+def build_catalog_table(rows: list[dict], definitions: dict[str, TableDefinition]) -> pd.DataFrame:
+    """
+    catalog テーブルを構築
+
+    Args:
+        rows: profile_table() で算出したカラムごとの統計情報
+        definitions: テーブル定義の辞書
+
+    Returns:
+        catalog テーブルの DataFrame（1 行 = 1 カラム）
+    """
+    # None を NaN に変換させないため object 型で保持
+    columns = definitions[CATALOG_TABLE].column_names
+    result = pd.DataFrame(rows, columns=columns, dtype=object)
+
+    logger.info(f"  {CATALOG_TABLE} テーブル完成: {len(result):,} 行")
+
+    return result
+
+
+def write_schema_info(catalog: pd.DataFrame, definitions: dict[str, TableDefinition], output_path: Path) -> None:
+    """
+    catalog からスキーマ情報 JSON（AI プロンプト・スキーマ参照用）を出力
+
+    catalog に含まれないテーブルは統計情報なし（null）で出力する
+
+    Args:
+        catalog: catalog テーブルの DataFrame
+        definitions: テーブル定義の辞書
+        output_path: 出力先 JSON ファイルのパス
+    """
+    stats = {(row["table_name"], row["column_name"]): row for row in catalog.to_dict("records")}
+
+    schema_info = []
+    for definition in definitions.values():
+        if definition.name == CATALOG_TABLE:
+            continue
+
+        row_count = next(
+            (stats[(definition.name, column.name)]["row_count"]
+             for column in definition.columns if (definition.name, column.name) in stats),
+            None
+        )
+
+        columns = []
+        for column in definition.columns:
+            column_stats = stats.get((definition.name, column.name), {})
+            columns.append({
+                "column_physical_name": column.name,
+                "column_logical_name": column.logical_name,
+                "data_type": column.data_type,
+                "null_rate": column_stats.get("null_rate"),
+                "distinct_count": column_stats.get("distinct_count"),
+                "top_values": column_stats.get("top_values"),
+                "min": column_stats.get("min_value"),
+                "max": column_stats.get("max_value"),
+            })
+
+        schema_info.append({
+            "table_physical_name": definition.name,
+            "table_logical_name": definition.logical_name,
+            "row_count": row_count,
+            "primary_keys": definition.primary_keys,
+            "columns": columns,
+        })
+
+    output_path.write_text(json.dumps(schema_info, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    logger.info(f"スキーマ情報を出力しました: {output_path}")
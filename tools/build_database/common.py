@@ -5,14 +5,44 @@
 """
 
 import logging
+import multiprocessing
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import neologdn
+import numpy as np
 import pandas as pd
 
+from .schema import ForeignKeyDefinition, TableDefinition
+from .spec import PROJECT_KEY_SOURCES, TableSpec
+from .texts import TextStore
+
 logger = logging.getLogger(__name__)
 
+# サンプリング時に CSV を分割して読み込む行数
+SAMPLE_CHUNK_SIZE = 100_000
+
+# サニタイズ・正規化の処理方式
+STRATEGY_SERIAL = "serial"      # 全行に順に適用
+STRATEGY_MEMOIZED = "memoized"  # 異なり値にのみ適用して各行に展開
+STRATEGY_PARALLEL = "parallel"  # 異なり値を分割してプロセスプールで並列に適用
+
+# 並列処理のプロセス数
+PARALLEL_WORKERS = os.cpu_count() or 1
+
+# 異なり値の合計文字数（概算）がこれ以上のカラムを並列処理する（プロセス間の受け渡しの費用を上回る分量）
+PARALLEL_MIN_CHARS = 2_000_000
+
+# 並列処理で 1 プロセスあたりに割り当てる分割数（分割ごとの処理時間のばらつきを均す）
+PARALLEL_CHUNKS_PER_WORKER = 2
+
+# 異なり数 / 行数がこれ以下のカラムは異なり値にのみ適用する
+MEMOIZE_MAX_DISTINCT_RATIO = 0.5
+
 
 def sanitize(text: str) -> Optional[str]:
     """
@@ -68,23 +98,142 @@ def normalize(text: str) -> Optional[str]:
         return text
 
 
-def load_csv(filepath: Path) -> pd.DataFrame:
+def sanitize_and_normalize(text: str) -> Optional[str]:
+    """サニタイズ後に正規化（長文カラムの texts テーブルへの格納用）"""
+    return normalize(sanitize(text))
+
+
+def sample_mask(df: pd.DataFrame, fraction: float) -> pd.Series:
+    """
+    事業年度・予算事業ID のハッシュ値で事業を選ぶ（同じ割合なら実行ごと・ファイルごとに同じ事業が選ばれる）
+
+    Args:
+        df: 読み込んだ CSV（事業年度・予算事業ID を含む）
+        fraction: 抽出する事業の割合（0 < fraction <= 1）
+
+    Returns:
+        抽出対象の行が True のマスク
+    """
+    threshold = fraction * 2 ** 32
+    year, project_id = (df[column].fillna("").str.strip() for column in PROJECT_KEY_SOURCES)
+    keys = year + "\t" + project_id
+    return keys.map(lambda key: zlib.crc32(key.encode("utf-8")) < threshold)
+
+
+def load_csv(filepath: Path, sample_fraction: Optional[float] = None) -> pd.DataFrame:
     """
     CSV ファイルを読み込む
 
     - UTF-8-SIG with BOM
     - 全カラムを文字列型として読み込み
+    - sample_fraction を指定した場合は抽出対象の事業の行のみ読み込む（外部キーの整合性を保つ）
     """
     logger.info(f"読み込み中: {filepath.name}")
-    df = pd.read_csv(filepath, encoding='utf-8-sig', dtype=str)
+    if sample_fraction is None:
+        df = pd.read_csv(filepath, encoding='utf-8-sig', dtype=str)
+    else:
+        header = pd.read_csv(filepath, encoding='utf-8-sig', dtype=str, nrows=0).columns
+        chunks = pd.read_csv(filepath, encoding='utf-8-sig', dtype=str, chunksize=SAMPLE_CHUNK_SIZE)
+        sampled = [chunk[sample_mask(chunk, sample_fraction)] for chunk in chunks if len(chunk)]
+        # ヘッダのみの CSV では抽出結果が空になるため、カラムを保った空の表にする
+        df = pd.concat(sampled, ignore_index=True) if sampled else pd.DataFrame(columns=header)
+        logger.info(f"  サンプリング: 事業の {sample_fraction:.1%}")
     logger.info(f"  行数: {len(df):,}, カラム数: {len(df.columns)}")
     return df
 
 
+def _clean_chunk(values: list[str], normalize_text: bool) -> list[Optional[str]]:
+    """値のリストにサニタイズ（・正規化）を適用（プロセスプールのワーカーで実行）"""
+    clean = sanitize_and_normalize if normalize_text else sanitize
+    return [clean(value) for value in values]
+
+
+@lru_cache(maxsize=1)
+def _process_pool() -> ProcessPoolExecutor:
+    """
+    並列処理のプロセスプール（初回の並列処理時に起動し、実行中は再利用）
+
+    アップロードのスレッドと並行して動くため fork は使わない
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=PARALLEL_WORKERS, mp_context=context)
+
+
+def choose_strategy(values: pd.Series) -> tuple[str, float, float]:
+    """
+    カラムの異なり数・平均文字数からサニタイズ・正規化の処理方式を選ぶ
+
+    - 異なり値の合計文字数が PARALLEL_MIN_CHARS 以上: parallel（長文で値がほぼ一意のカラム）
+    - 異なり数 / 行数が MEMOIZE_MAX_DISTINCT_RATIO 以下: memoized（府省庁名などの繰り返しの多いカラム）
+    - それ以外: serial
+
+    Args:
+        values: 対象カラム
+
+    Returns:
+        (処理方式, 異なり数 / 行数, 平均文字数)
+    """
+    non_null = values.dropna()
+    if non_null.empty:
+        return STRATEGY_SERIAL, 0.0, 0.0
+
+    distinct_ratio = non_null.nunique() / len(non_null)
+    average_length = float(non_null.str.len().mean())
+
+    if PARALLEL_WORKERS > 1 and distinct_ratio * len(non_null) * average_length >= PARALLEL_MIN_CHARS:
+        return STRATEGY_PARALLEL, distinct_ratio, average_length
+    if distinct_ratio <= MEMOIZE_MAX_DISTINCT_RATIO:
+        return STRATEGY_MEMOIZED, distinct_ratio, average_length
+    return STRATEGY_SERIAL, distinct_ratio, average_length
+
+
+def clean_column(values: pd.Series, normalize_text: bool, strategy: Optional[str] = None) -> pd.Series:
+    """
+    カラムにサニタイズ（normalize_text の場合は正規化も）を適用
+
+    Args:
+        values: 対象カラム（文字列または欠損値）
+        normalize_text: 正規化を行うか
+        strategy: 処理方式（None の場合は choose_strategy() で選ぶ）
+
+    Returns:
+        処理後のカラム（欠損値は None）
+    """
+    distinct_ratio = average_length = None
+    if strategy is None:
+        strategy, distinct_ratio, average_length = choose_strategy(values)
+
+    if strategy == STRATEGY_SERIAL:
+        result = values.apply(sanitize_and_normalize if normalize_text else sanitize)
+    else:
+        uniques = values.dropna().unique()
+        if strategy == STRATEGY_PARALLEL:
+            # 連続した大きな分割単位で受け渡す（値ごとの受け渡しの費用を避ける）
+            chunks = np.array_split(uniques, min(len(uniques), PARALLEL_WORKERS * PARALLEL_CHUNKS_PER_WORKER) or 1)
+            cleaned = [
+                value
+                for chunk in _process_pool().map(
+                    _clean_chunk, [chunk.tolist() for chunk in chunks], [normalize_text] * len(chunks)
+                )
+                for value in chunk
+            ]
+        else:
+            cleaned = _clean_chunk(uniques.tolist(), normalize_text)
+        result = values.map(dict(zip(uniques, cleaned)))
+
+    stats = "" if distinct_ratio is None else f", 異なり {distinct_ratio:.0%}, 平均 {average_length:,.0f} 文字"
+    logger.info(f"  {values.name}: {strategy}{'（正規化）' if normalize_text else ''}{stats}")
+
+    return result.astype(object).where(result.notna(), None)
+
+
 def apply_sanitize_and_normalize(df: pd.DataFrame, normalize_columns: set) -> pd.DataFrame:
     """
     DataFrame 全体にサニタイズと正規化を適用
 
+    カラムごとに異なり数・平均文字数から処理方式（serial / memoized / parallel）を選び、ログに出力する
+
     Args:
         df: 対象 DataFrame
         normalize_columns: 正規化対象カラム名のセット
@@ -94,21 +243,135 @@ def apply_sanitize_and_normalize(df: pd.DataFrame, normalize_columns: set) -> pd
     """
     logger.info("サニタイズ・正規化を適用中...")
 
-    # 1. 全カラムにサニタイズ
-    for col in df.columns:
-        df[col] = df[col].apply(sanitize)
-
-    # 2. 正規化対象カラムのみ処理
     for col in df.columns:
-        if col in normalize_columns:
-            # 正規化
-            df[col] = df[col].apply(normalize)
-            logger.info(f"  正規化: {col}")
+        df[col] = clean_column(df[col], col in normalize_columns)
 
     return df
 
 
-def validate_table(df: pd.DataFrame, table_name: str, primary_keys: list) -> None:
+def build_table(
+    spec: TableSpec, sources: dict[str, pd.DataFrame], text_store: Optional[TextStore] = None
+) -> pd.DataFrame:
+    """
+    カラム対応定義に従って CSV からテーブルを構築
+
+    CSV ごとに使用するカラムだけを選択してサニタイズ・正規化し、
+    行の除外・seq_no の採番・カラム名の変更・型変換を行う
+    長文カラムはサニタイズ・正規化せずに取り出し、text_store でテキストID に置き換える
+
+    Args:
+        spec: テーブル定義
+        sources: CSV ファイル名（拡張子なし）をキー、読み込んだ DataFrame を値とする辞書
+        text_store: 長文カラムのテキストID の対応（None の場合はこのテーブル限りの対応を使用）
+
+    Returns:
+        テーブル定義のカラム順の DataFrame
+    """
+    logger.info(f"{spec.name} テーブル構築中...")
+
+    if text_store is None:
+        text_store = TextStore()
+    text_sources = spec.text_sources
+
+    # CSV ごとに使用するカラムを割り当て（複数の CSV にあるカラムは先の CSV を使用）
+    assigned = set(PROJECT_KEY_SOURCES)
+    frames = []
+    for source_name in spec.sources:
+        source = sources[source_name]
+        columns = [column for column in spec.source_columns if column in source.columns and column not in assigned]
+        assigned.update(columns)
+
+        # 使用するカラムだけを取り出してサニタイズ・正規化（元の CSV は他のテーブルの構築に使うため変更しない）
+        texts = [column for column in columns if column in text_sources]
+        df = apply_sanitize_and_normalize(
+            source[[*PROJECT_KEY_SOURCES, *(column for column in columns if column not in text_sources)]].copy(),
+            spec.normalize_sources
+        )
+        df[texts] = source[texts]
+
+        if len(spec.sources) > 1:
+            # 同一事業が複数行ある場合があるため、最初の行のみを使用
+            deduplicated = df.drop_duplicates(subset=list(PROJECT_KEY_SOURCES), keep="first")
+            logger.info(f"  {source_name} 重複除去: {len(df):,} → {len(deduplicated):,} 行")
+            df = deduplicated
+        frames.append(df)
+
+    df = frames[0]
+    for other in frames[1:]:
+        df = df.merge(other, on=list(PROJECT_KEY_SOURCES), how="inner")
+    if len(frames) > 1:
+        logger.info(f"  結合後の行数: {len(df):,}")
+
+    if spec.required:
+        df = df[df[spec.required].notna()]
+
+    result = {}
+    for column in spec.columns:
+        if column.deduplicate:
+            values = text_store.intern(
+                df[column.source],
+                lambda raws: clean_column(raws, normalize_text=column.normalize),
+                "normalize" if column.normalize else "sanitize",
+            )
+        elif column.source is not None:
+            values = df[column.source]
+        elif column.name == "seq_no" and spec.seq_no_keys:
+            # 同一事業（予算年度）内での連番
+            values = df.groupby(list(spec.seq_no_keys)).cumcount() + 1
+        else:
+            # 後続の処理で付与するカラム
+            continue
+
+        if column.data_type == "BIGINT":
+            values = pd.to_numeric(values, errors='coerce').astype('Int64')
+        result[column.name] = values
+
+    table = pd.DataFrame(result).reset_index(drop=True)
+
+    logger.info(f"  {spec.name} テーブル完成: {len(table):,} 行, {len(table.columns)} カラム")
+
+    return table
+
+
+def iter_spec_tables(
+    specs: tuple[TableSpec, ...],
+    input_dir: Path,
+    sample_fraction: Optional[float] = None,
+    text_store: Optional[TextStore] = None,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    テーブル定義の順にテーブルを構築・検証して返す
+
+    CSV は最初に使うテーブルの構築時に読み込み、最後に使うテーブルの構築後に解放する
+
+    Args:
+        specs: テーブル定義（構築順）
+        input_dir: CSV ファイルが格納されているディレクトリ
+        sample_fraction: 抽出する事業の割合（None の場合は全件）
+        text_store: 長文カラムのテキストID の対応（texts テーブルは呼び出し側で構築する）
+
+    Yields:
+        (テーブル名, DataFrame)
+    """
+    last_use = {source: i for i, spec in enumerate(specs) for source in spec.sources}
+
+    sources: dict[str, pd.DataFrame] = {}
+    for i, spec in enumerate(specs):
+        for source in spec.sources:
+            if source not in sources:
+                sources[source] = load_csv(input_dir / f"{source}.csv", sample_fraction)
+
+        table = build_table(spec, sources, text_store)
+        validate_table(table, spec.name, list(spec.primary_keys))
+
+        for source in spec.sources:
+            if last_use[source] == i:
+                del sources[source]
+
+        yield spec.name, table
+
+
+def validate_table(df: pd.DataFrame, table_name: str, primary_keys: list) -> int:
     """
     テーブルのデータ品質を検証
 
@@ -116,6 +379,9 @@ def validate_table(df: pd.DataFrame, table_name: str, primary_keys: list) -> Non
         df: 対象 DataFrame
         table_name: テーブル名
         primary_keys: 主キーカラム名のリスト
+
+    Returns:
+        主キーが重複している行数
     """
     logger.info(f"=== {table_name} テーブル検証 ===")
 
@@ -134,3 +400,49 @@ def validate_table(df: pd.DataFrame, table_name: str, primary_keys: list) -> Non
     high_null_cols = null_rates[null_rates > 0.5]
     if len(high_null_cols) > 0:
         logger.info(f"  NULL 率 50% 超のカラム: {len(high_null_cols)} 個")
+
+    return int(duplicates)
+
+
+def validate_tables(
+    tables: dict[str, pd.DataFrame],
+    definitions: dict[str, TableDefinition],
+    foreign_keys: list[ForeignKeyDefinition],
+) -> int:
+    """
+    構築済みテーブル全体のデータ品質を検証
+
+    - テーブルごとの検証（主キー重複・NULL 率）
+    - 外部キー制約の参照切れ（参照先にない行）
+
+    Args:
+        tables: テーブル名をキー、DataFrame を値とする辞書
+        definitions: テーブル定義の辞書
+        foreign_keys: 外部キー制約の定義のリスト
+
+    Returns:
+        問題のある行数（主キー重複 + 参照切れ）
+    """
+    problems = 0
+    for table_name, df in tables.items():
+        problems += validate_table(df, table_name, definitions[table_name].primary_keys)
+
+    logger.info("=== 外部キー検証 ===")
+    for foreign_key in foreign_keys:
+        df = tables.get(foreign_key.table_name)
+        referenced = tables.get(foreign_key.referenced_table_name)
+        if df is None or referenced is None:
+            continue
+
+        keys = df[foreign_key.columns].dropna()
+        referenced_keys = referenced[foreign_key.referenced_columns].set_axis(foreign_key.columns, axis=1)
+        orphans = len(keys.merge(referenced_keys.drop_duplicates(), how="left", indicator=True)
+                      .query("_merge == 'left_only'"))
+        if orphans > 0:
+            logger.warning(f"  {foreign_key.table_name} → {foreign_key.referenced_table_name}: 参照切れ {orphans:,} 行")
+        else:
+            logger.info(f"  {foreign_key.table_name} → {foreign_key.referenced_table_name}: 参照切れなし")
+        problems += orphans
+
+    return problems
+
@@ -0,0 +1,208 @@
+"""
+組み込みデータベース出力モジュール
+
+構築済みテーブルを DuckDB / SQLite の単一ファイルに書き出す
+Supabase を起動せずにローカル分析・CI でデータセット全体を参照するために使用する
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .schema import TableDefinition
+
+logger = logging.getLogger(__name__)
+
+# 出力先として指定できる組み込みデータベース
+EMBEDDED_ENGINES = ("duckdb", "sqlite")
+
+# seed.sql の型 → 組み込みデータベースの型
+TYPE_MAPPING = {
+    "duckdb": {
+        "BIGINT": "BIGINT",
+        "TEXT": "VARCHAR",
+        "JSONB": "VARCHAR",
+        "NUMERIC": "DOUBLE",
+        "DOUBLE PRECISION": "DOUBLE",
+    },
+    "sqlite": {
+        "BIGINT": "INTEGER",
+        "TEXT": "TEXT",
+        "JSONB": "TEXT",
+        "NUMERIC": "NUMERIC",
+        "DOUBLE PRECISION": "REAL",
+    },
+}
+
+# 主キー以外に作成するインデックス（検索・集計でよく使うカラム）
+SECONDARY_INDEXES = {
+    "projects_master": [["ministry"], ["old_project_number"]],
+    "related_projects": [["related_project_id"]],
+    "project_lineage": [["lineage_id", "project_year"]],
+    "budgets": [["budget_year"]],
+    "budget_items": [["budget_year"], ["budget_item"]],
+    "budget_cube": [[
+        "grouping_id", "project_year", "budget_year", "ministry", "bureau", "account_category", "budget_item"
+    ]],
+    "expenditures": [["recipient_name"], ["corporate_number"], ["recipient_id"]],
+    "recipients": [["corporate_number"]],
+    "expenditure_usages": [["corporate_number"]],
+    "expenditure_contracts": [["contractor_corporate_number"]],
+}
+
+
+def parse_target(target: str) -> tuple[str, Optional[Path]]:
+    """
+    出力先指定（supabase / duckdb:path / sqlite:path）を解析
+
+    Args:
+        target: 出力先指定文字列
+
+    Returns:
+        (エンジン名, データベースファイルのパス)。supabase の場合パスは None
+    """
+    if target == "supabase":
+        return "supabase", None
+
+    engine, _, path = target.partition(":")
+    if engine not in EMBEDDED_ENGINES or not path:
+        raise ValueError(f"出力先の指定が不正です: {target}（supabase / duckdb:path / sqlite:path）")
+
+    return engine, Path(path).expanduser().resolve()
+
+
+def create_table_sql(definition: TableDefinition, engine: str) -> str:
+    """組み込みデータベース用の CREATE TABLE 文を生成"""
+    types = TYPE_MAPPING[engine]
+    lines = [f'    "{column.name}" {types.get(column.data_type, column.data_type)}' for column in definition.columns]
+    if definition.primary_keys:
+        keys = ", ".join(f'"{key}"' for key in definition.primary_keys)
+        lines.append(f"    PRIMARY KEY ({keys})")
+    return f'CREATE TABLE "{definition.name}" (\n' + ",\n".join(lines) + "\n)"
+
+
+def create_index_sqls(definition: TableDefinition) -> list[str]:
+    """主キー以外のインデックスの CREATE INDEX 文を生成"""
+    sqls = []
+    for columns in SECONDARY_INDEXES.get(definition.name, []):
+        if not set(columns) <= set(definition.column_names):
+            continue
+        index_name = f"idx_{definition.name}_{'_'.join(columns)}"
+        keys = ", ".join(f'"{column}"' for column in columns)
+        sqls.append(f'CREATE INDEX "{index_name}" ON "{definition.name}" ({keys})')
+    return sqls
+
+
+def _prepare_frame(df: pd.DataFrame, definition: TableDefinition) -> pd.DataFrame:
+    """テーブル定義の型に合わせてカラムを変換（JSONB は JSON 文字列化）"""
+    prepared = {}
+    for column in definition.columns:
+        series = df[column.name] if column.name in df.columns else pd.Series([None] * len(df), index=df.index)
+
+        if column.data_type == "BIGINT":
+            prepared[column.name] = pd.to_numeric(series, errors="coerce").astype("Int64")
+        elif column.is_numeric:
+            prepared[column.name] = pd.to_numeric(series, errors="coerce").astype("float64")
+        elif column.data_type == "JSONB":
+            prepared[column.name] = series.map(
+                lambda value: None if value is None else json.dumps(value, ensure_ascii=False)
+            ).astype(object)
+        else:
+            prepared[column.name] = series.astype(object)
+
+    frame = pd.DataFrame(prepared, index=df.index)
+
+    # Supabase の upsert と同様に主キー重複は後勝ちとする（主キー制約違反の回避）
+    if definition.primary_keys:
+        duplicated = frame.duplicated(subset=definition.primary_keys, keep="last")
+        if duplicated.any():
+            logger.warning(f"  {definition.name}: 主キー重複 {int(duplicated.sum())} 件を除外（後勝ち）")
+            frame = frame[~duplicated]
+
+    return frame
+
+
+def _write_duckdb(tables: dict[str, pd.DataFrame], definitions: dict[str, TableDefinition], path: Path) -> None:
+    try:
+        import duckdb
+    except ImportError as e:
+        raise RuntimeError("duckdb がインストールされていません（pip install duckdb）") from e
+
+    con = duckdb.connect(str(path))
+    try:
+        for table_name, df in tables.items():
+            definition = definitions[table_name]
+            con.execute(create_table_sql(definition, "duckdb"))
+
+            frame = _prepare_frame(df, definition)
+            con.register("frame", frame)
+            con.execute(f'INSERT INTO "{table_name}" SELECT * FROM frame')
+            con.unregister("frame")
+
+            for sql in create_index_sqls(definition):
+                con.execute(sql)
+            logger.info(f"  {table_name} テーブル書き込み完了 ({len(df):,} 行)")
+    finally:
+        con.close()
+
+
+def _write_sqlite(tables: dict[str, pd.DataFrame], definitions: dict[str, TableDefinition], path: Path) -> None:
+    con = sqlite3.connect(path)
+    try:
+        # 新規ファイルへの一括書き込みのためジャーナル・同期を無効化
+        con.execute("PRAGMA journal_mode = OFF")
+        con.execute("PRAGMA synchronous = OFF")
+
+        for table_name, df in tables.items():
+            definition = definitions[table_name]
+            con.execute(create_table_sql(definition, "sqlite"))
+
+            frame = _prepare_frame(df, definition).astype(object)
+            frame = frame.where(frame.notna(), None)
+            placeholders = ", ".join("?" * len(definition.columns))
+            con.executemany(
+                f'INSERT INTO "{table_name}" VALUES ({placeholders})',
+                frame.itertuples(index=False, name=None)
+            )
+
+            for sql in create_index_sqls(definition):
+                con.execute(sql)
+            con.commit()
+            logger.info(f"  {table_name} テーブル書き込み完了 ({len(df):,} 行)")
+    finally:
+        con.close()
+
+
+def write_embedded_database(
+    tables: dict[str, pd.DataFrame],
+    definitions: dict[str, TableDefinition],
+    engine: str,
+    path: Path
+) -> None:
+    """
+    全テーブルを組み込みデータベースファイルに書き出す（既存ファイルは置き換え）
+
+    Args:
+        tables: テーブル名をキー、DataFrame を値とする辞書
+        definitions: テーブル定義の辞書
+        engine: duckdb / sqlite
+        path: 出力先データベースファイルのパス
+    """
+    logger.info(f"{engine} データベースに書き込み: {path}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    if engine == "duckdb":
+        _write_duckdb(tables, definitions, path)
+    elif engine == "sqlite":
+        _write_sqlite(tables, definitions, path)
+    else:
+        raise ValueError(f"未対応のデータベースです: {engine}")
+
+    logger.info(f"{engine} データベースの書き込みが完了しました: {path}")
@@ -0,0 +1,73 @@
+"""
+Zip ファイル解凍モジュール
+
+RS システムからダウンロードした Zip ファイルを解凍し、CSV ファイルを 1 つのディレクトリに配置する
+（標準ライブラリのみを使用し、pandas などは読み込まない）
+"""
+
+import logging
+import shutil
+import zipfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def extract_zip_files(zip_dir: Path, csv_dir: Path) -> None:
+    """指定された Zip ファイルを解凍して CSV ファイルを csv_dir に配置する"""
+    logger.info("Zip ファイルの解凍を開始")
+
+    # csv_dir が存在する場合は削除して再作成
+    if csv_dir.exists():
+        shutil.rmtree(csv_dir)
+    csv_dir.mkdir(parents=True, exist_ok=True)
+
+    # 対象の Zip ファイル名を定義
+    target_zip_files = [
+        "1-1_RS_2024_基本情報_組織情報.zip",
+        "1-2_RS_2024_基本情報_事業概要等.zip",
+        "1-3_RS_2024_基本情報_政策・施策、法令等.zip",
+        "1-4_RS_2024_基本情報_補助率等.zip",
+        "1-5_RS_2024_基本情報_関連事業.zip",
+        "2-1_RS_2024_予算・執行_サマリ.zip",
+        "2-2_RS_2024_予算・執行_予算種別・歳出予算項目.zip",
+        "5-1_RS_2024_支出先_支出情報.zip",
+        "5-2_RS_2024_支出先_支出ブロックのつながり.zip",
+        "5-3_RS_2024_支出先_費目・使途.zip",
+        "5-4_RS_2024_支出先_国庫債務負担行為等による契約.zip"
+    ]
+
+    for zip_filename in target_zip_files:
+        zip_file = zip_dir / zip_filename
+        if not zip_file.exists():
+            raise FileNotFoundError(f"Zip ファイルが見つかりません: {zip_file}")
+
+        logger.info(f"  解凍中: {zip_filename}")
+
+        # 一時解凍ディレクトリ
+        temp_extract_dir = csv_dir / f"temp_{zip_file.stem}"
+        temp_extract_dir.mkdir(exist_ok=True)
+
+        # Zip ファイルを解凍
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            zip_ref.extractall(temp_extract_dir)
+
+        # 解凍されたファイルから CSV ファイルを検索して移動
+        _move_csv_files_to_csv_dir(temp_extract_dir, csv_dir)
+
+        # 一時ディレクトリを削除
+        shutil.rmtree(temp_extract_dir)
+
+    logger.info(f"Zip ファイルの解凍が完了しました: {csv_dir}")
+
+
+def _move_csv_files_to_csv_dir(source_dir: Path, target_dir: Path) -> None:
+    """再帰的に CSV ファイルを検索して target_dir 直下に移動する"""
+    for item in source_dir.rglob('*'):
+        if item.is_file() and item.suffix.lower() == '.csv':
+            # ファイル名が重複しないようにする（必要に応じて）
+            target_path = target_dir / item.name
+            if target_path.exists():
+                logger.warning(f"  CSV ファイル名が重複しています: {item.name} (上書きします)")
+            shutil.move(str(item), str(target_path))
+            logger.info(f"    CSV ファイル移動: {item.name}")
@@ -0,0 +1,136 @@
+"""
+事業系譜モジュール
+
+予算事業ID・旧事業番号・関連事業（統合・分割などの継承関係）から年度をまたいだ同一事業の系譜を解決し、
+project_lineage テーブルを構築する
+事業ごとの予算・支出の経年推移を、旧事業番号・関連事業を再帰的にたどらずに
+系譜ID の 1 回のインデックス検索で取得できるようにする
+"""
+
+import logging
+import re
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# project_lineage テーブルのテーブル名
+LINEAGE_TABLE = "project_lineage"
+
+# 系譜としてたどる関連事業の関連性（継承関係を表すもののみ。単なる関連事業は結合しない）
+LINEAGE_RELATION_PATTERN = re.compile(r"統合|分割|移管|前身|後継|継続|引継|引き継|組替|再編")
+
+# 旧事業番号の区切り文字（統合事業では複数の旧事業番号が記載される）
+_OLD_NUMBER_SEPARATOR = re.compile(r"[、,，;；\s]+")
+
+# 同じ旧事業番号を持つ予算事業ID の上限（超える場合は「新規」等の記載とみなして結合しない）
+MAX_PROJECTS_PER_OLD_NUMBER = 5
+
+
+class _UnionFind:
+    """予算事業ID・旧事業番号をノードとする Union-Find"""
+
+    def __init__(self):
+        self.parent: dict[str, str] = {}
+
+    def find(self, node: str) -> str:
+        self.parent.setdefault(node, node)
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+
+    def union(self, a: str, b: str) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+def _old_numbers(value) -> list[str]:
+    """旧事業番号の記載を個々の番号に分割（数字を含まない記載は除外）"""
+    if not isinstance(value, str):
+        return []
+    return [number for number in _OLD_NUMBER_SEPARATOR.split(value) if any(c.isdigit() for c in number)]
+
+
+def build_project_lineage(projects_master: pd.DataFrame, related_projects: pd.DataFrame) -> pd.DataFrame:
+    """
+    project_lineage テーブルを構築
+
+    次の予算事業ID を同じ系譜として結合する
+        - 予算事業ID が同じ（年度をまたいで同一の事業）
+        - 旧事業番号が同じ、または旧事業番号が別の事業の予算事業ID と一致
+        - 関連事業の関連性が継承関係（統合・分割・移管など）
+
+    系譜ID は系譜内で最も古い事業年度の予算事業ID（同年度が複数ある場合は最小の ID）
+
+    Args:
+        projects_master: projects_master テーブル
+        related_projects: related_projects テーブル
+
+    Returns:
+        project_lineage テーブルの DataFrame（1 行 = 1 事業年度・予算事業ID）
+    """
+    logger.info(f"{LINEAGE_TABLE} テーブル構築中...")
+
+    projects = projects_master[["project_year", "project_id", "old_project_number"]].dropna(
+        subset=["project_year", "project_id"]
+    )
+    project_ids = set(projects["project_id"])
+
+    union_find = _UnionFind()
+    for project_id in project_ids:
+        union_find.find(project_id)
+
+    # 旧事業番号による結合
+    old_numbers = projects[["project_id"]].assign(
+        old_number=projects["old_project_number"].map(_old_numbers)
+    ).explode("old_number").dropna(subset=["old_number"]).drop_duplicates()
+    shared = old_numbers.groupby("old_number")["project_id"].nunique()
+    ambiguous = shared[shared > MAX_PROJECTS_PER_OLD_NUMBER].index
+    if len(ambiguous) > 0:
+        logger.warning(f"  {len(ambiguous)} 件の旧事業番号は共有する事業が多すぎるため結合しません")
+        old_numbers = old_numbers[~old_numbers["old_number"].isin(ambiguous)]
+
+    old_number_links = 0
+    for project_id, old_number in zip(old_numbers["project_id"], old_numbers["old_number"]):
+        if old_number in project_ids:
+            union_find.union(old_number, project_id)
+        else:
+            union_find.union(f"旧:{old_number}", project_id)
+        old_number_links += 1
+
+    # 関連事業（継承関係）による結合
+    relations = related_projects[
+        related_projects["relation_type"].astype("string").str.contains(LINEAGE_RELATION_PATTERN, na=False)
+        & related_projects["related_project_id"].isin(project_ids)
+    ]
+    for project_id, related_project_id in zip(relations["project_id"], relations["related_project_id"]):
+        union_find.union(project_id, related_project_id)
+
+    logger.info(f"  旧事業番号による結合: {old_number_links:,} 件, 関連事業による結合: {len(relations):,} 件")
+
+    # 系譜ごとの年度の並び
+    result = projects[["project_year", "project_id"]].drop_duplicates().copy()
+    result["project_year"] = result["project_year"].astype("Int64")
+    result["root"] = result["project_id"].map(union_find.find)
+    result = result.sort_values(["root", "project_year", "project_id"])
+
+    lineages = result.groupby("root", sort=False)
+    result["lineage_id"] = lineages["project_id"].transform("first")
+    result["year_sequence"] = lineages["project_year"].rank(method="dense").astype("Int64")
+    result["first_year"] = lineages["project_year"].transform("min")
+    result["last_year"] = lineages["project_year"].transform("max")
+    result["project_count"] = lineages["project_id"].transform("nunique").astype("Int64")
+    years = lineages["project_year"].agg(lambda values: sorted({int(year) for year in values}))
+    result["lineage_years"] = result["root"].map(years)
+
+    result = result.drop(columns="root").sort_values(["lineage_id", "project_year", "project_id"]).reset_index(drop=True)
+
+    logger.info(
+        f"  {LINEAGE_TABLE} テーブル完成: {len(result):,} 行, "
+        f"系譜 {result['lineage_id'].nunique():,} 件（複数の予算事業ID を含む系譜 "
+        f"{result.loc[result['project_count'] > 1, 'lineage_id'].nunique():,} 件）"
+    )
+
+    return result
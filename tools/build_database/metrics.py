@@ -0,0 +1,392 @@
+"""
+実行履歴メトリクスモジュール
+
+build_database.py の実行ごとに段階別の処理時間・行数・行数/秒・ピークメモリを
+実行履歴（tools/output/run_history.sqlite）に追記し、Prometheus の textfile 形式でも出力する
+直近の実行の処理速度を過去の実行（移動中央値）と比較し、一定以上低下した段階を検出する
+
+（標準ライブラリのみを使用し、pandas などは読み込まない）
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 比較の基準とする過去の実行数（移動中央値の窓）
+BASELINE_WINDOW = 7
+
+# 処理速度の低下とみなす割合（基準の行数/秒に対する低下率。行数がない段階は処理時間の増加率）
+REGRESSION_THRESHOLD = 0.2
+
+# 比較の対象とする最短の処理時間（秒）。これより短い段階は計測の揺らぎが大きいため比較しない
+MIN_STAGE_SECONDS = 1.0
+
+# Prometheus のメトリクス名の接頭辞
+METRIC_PREFIX = "rs_build"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    command TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    sample_fraction REAL,
+    status TEXT NOT NULL,
+    elapsed_seconds REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS stage_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    rows INTEGER,
+    rows_per_second REAL,
+    peak_memory_bytes INTEGER,
+    PRIMARY KEY (run_id, stage)
+);
+"""
+
+
+@dataclass
+class StageMetrics:
+    """段階ごとの計測値"""
+    stage: str
+    seconds: float = 0.0
+    rows: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        # 行数が 0（再開時に全て書き込み済みなど）の段階は処理時間で比較する
+        if not self.rows or self.seconds <= 0:
+            return None
+        return self.rows / self.seconds
+
+
+@dataclass
+class Comparison:
+    """段階ごとの過去の実行との比較結果"""
+    stage: str
+    # 比較した指標（rows_per_second / seconds）
+    metric: str
+    baseline: float
+    latest: float
+    baseline_runs: int
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """基準からの変化率"""
+        return self.latest / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        if self.metric == "rows_per_second":
+            return self.change < -self.threshold
+        return self.change > self.threshold
+
+
+def _reset_peak_memory() -> None:
+    """プロセスの最大常駐メモリ（VmHWM）をリセット（Linux のみ）"""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def _peak_memory_bytes() -> Optional[int]:
+    """プロセスの最大常駐メモリ（Linux は前回のリセット以降、それ以外はプロセス開始以降）"""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS はバイト、それ以外は KB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RunRecorder:
+    """
+    1 回の実行の段階別メトリクスを記録
+
+    段階名の "/" 以降はテーブル単位の内訳（例: build/projects_master）
+    内訳はアップロードのスレッドからも記録するため、記録はロックで保護する
+    """
+
+    def __init__(self, command: str, arguments: dict, sample_fraction: Optional[float] = None):
+        self.command = command
+        self.arguments = arguments
+        self.sample_fraction = sample_fraction
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.stages: dict[str, StageMetrics] = {}
+        self._lock = threading.Lock()
+
+    def add(self, metrics: StageMetrics) -> None:
+        """計測値を記録（同じ段階名は処理時間・行数を合算）"""
+        with self._lock:
+            current = self.stages.get(metrics.stage)
+            if current is None:
+                self.stages[metrics.stage] = metrics
+                return
+            current.seconds += metrics.seconds
+            if metrics.rows is not None:
+                current.rows = (current.rows or 0) + metrics.rows
+            if metrics.peak_memory_bytes is not None:
+                current.peak_memory_bytes = max(current.peak_memory_bytes or 0, metrics.peak_memory_bytes)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """
+        with ブロックの処理時間・ピークメモリを段階 name として記録（行数はブロック内で設定する）
+
+        内訳（"/" を含む段階）以外は開始時に最大常駐メモリをリセットし、段階内のピークを計測する
+        """
+        if "/" not in name:
+            _reset_peak_memory()
+        metrics = StageMetrics(name)
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.seconds = time.perf_counter() - start
+            metrics.peak_memory_bytes = _peak_memory_bytes()
+            self.add(metrics)
+
+    def track_tables(self, stage: str, tables: Iterator[tuple]) -> Iterator[tuple]:
+        """
+        (テーブル名, DataFrame) を返すイテレータの各テーブルの構築時間・行数を stage/テーブル名 として記録
+
+        構築側の処理時間のみを計測する（返した後の書き込み・待ち時間を含まない）
+        """
+        while True:
+            start = time.perf_counter()
+            try:
+                table_name, df = next(tables)
+            except StopIteration:
+                return
+            self.add(StageMetrics(
+                f"{stage}/{table_name}", time.perf_counter() - start, len(df), _peak_memory_bytes()
+            ))
+            yield table_name, df
+
+    def aggregate(self, stage: str) -> None:
+        """内訳（stage/テーブル名）の処理時間・行数を合算して段階 stage として記録"""
+        with self._lock:
+            parts = [metrics for name, metrics in self.stages.items() if name.startswith(f"{stage}/")]
+        if not parts:
+            return
+        rows = [metrics.rows for metrics in parts if metrics.rows is not None]
+        peaks = [metrics.peak_memory_bytes for metrics in parts if metrics.peak_memory_bytes is not None]
+        self.add(StageMetrics(
+            stage,
+            seconds=sum(metrics.seconds for metrics in parts),
+            rows=sum(rows) if rows else None,
+            peak_memory_bytes=max(peaks) if peaks else None,
+        ))
+
+    def save(self, history_path: Path, status: str) -> int:
+        """
+        実行履歴に追記
+
+        Args:
+            history_path: 実行履歴の SQLite ファイルのパス
+            status: 実行結果（success / failed / error）
+
+        Returns:
+            追記した実行の run_id
+        """
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(history_path) as con:
+            con.executescript(_SCHEMA)
+            run_id = con.execute(
+                "INSERT INTO runs (started_at, command, arguments, sample_fraction, status, elapsed_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.started_at.isoformat(timespec="seconds"), self.command,
+                    json.dumps(self.arguments, ensure_ascii=False, sort_keys=True, default=str), self.sample_fraction,
+                    status, time.perf_counter() - self.started,
+                ),
+            ).lastrowid
+            con.executemany(
+                "INSERT INTO stage_metrics (run_id, stage, seconds, rows, rows_per_second, peak_memory_bytes) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, m.stage, m.seconds, m.rows, m.rows_per_second, m.peak_memory_bytes)
+                    for m in self.stages.values()
+                ],
+            )
+        con.close()
+
+        logger.info(f"実行履歴に記録しました: run_id={run_id} ({history_path})")
+        return run_id
+
+
+def compare_run(
+    history_path: Path,
+    run_id: Optional[int] = None,
+    window: int = BASELINE_WINDOW,
+    threshold: float = REGRESSION_THRESHOLD,
+) -> tuple[Optional[int], list[Comparison]]:
+    """
+    実行の段階ごとの処理速度を、同じコマンド・同じ引数（出力先・--resume など）・同じ抽出割合で
+    成功した直前 window 回の実行の中央値と比較
+
+    行数のある段階は行数/秒、行数のない段階（extract など）は処理時間で比較する
+    今回・基準ともに MIN_STAGE_SECONDS 未満の段階は比較しない
+
+    Args:
+        history_path: 実行履歴の SQLite ファイルのパス
+        run_id: 比較する実行（None の場合は最新の実行）
+        window: 基準とする過去の実行数
+        threshold: 低下とみなす割合
+
+    Returns:
+        (比較した run_id, 段階ごとの比較結果)。実行履歴がない場合は (None, [])
+    """
+    if not history_path.exists():
+        return None, []
+
+    con = sqlite3.connect(history_path)
+    try:
+        row = con.execute(
+            "SELECT run_id, command, arguments, sample_fraction FROM runs "
+            + ("WHERE run_id = ?" if run_id is not None else "ORDER BY run_id DESC LIMIT 1"),
+            (run_id,) if run_id is not None else (),
+        ).fetchone()
+        if row is None:
+            return None, []
+        run_id, command, arguments, sample_fraction = row
+
+        # 出力先（Supabase / DuckDB / SQLite）や再開の有無で処理速度が異なるため、引数が同じ実行のみを基準とする
+        baseline_runs = [
+            baseline_run_id for (baseline_run_id,) in con.execute(
+                "SELECT run_id FROM runs WHERE run_id < ? AND command = ? AND arguments = ? AND sample_fraction IS ? "
+                "AND status = 'success' ORDER BY run_id DESC LIMIT ?",
+                (run_id, command, arguments, sample_fraction, window),
+            )
+        ]
+        if not baseline_runs:
+            return run_id, []
+
+        def load(run_ids: list[int]) -> dict[str, list[tuple]]:
+            stages: dict[str, list[tuple]] = {}
+            placeholders = ", ".join("?" * len(run_ids))
+            for stage, seconds, rows_per_second in con.execute(
+                f"SELECT stage, seconds, rows_per_second FROM stage_metrics WHERE run_id IN ({placeholders})",
+                run_ids,
+            ):
+                stages.setdefault(stage, []).append((seconds, rows_per_second))
+            return stages
+
+        latest = load([run_id])
+        baseline = load(baseline_runs)
+    finally:
+        con.close()
+
+    comparisons = []
+    for stage, [(seconds, rows_per_second)] in latest.items():
+        history = baseline.get(stage, [])
+        if not history or max(seconds, statistics.median(value for value, _ in history)) < MIN_STAGE_SECONDS:
+            continue
+        if rows_per_second is not None:
+            values = [value for _, value in history if value is not None]
+            metric, value = "rows_per_second", rows_per_second
+        else:
+            values = [value for value, _ in history]
+            metric, value = "seconds", seconds
+        if values:
+            comparisons.append(Comparison(stage, metric, statistics.median(values), value, len(values), threshold))
+
+    return run_id, comparisons
+
+
+def log_comparisons(run_id: Optional[int], comparisons: list[Comparison]) -> None:
+    """比較結果をログに出力（低下した段階は WARNING）"""
+    if not comparisons:
+        logger.info("比較対象の実行履歴がありません")
+        return
+
+    logger.info(f"処理速度の比較: run_id={run_id}（基準: 過去の実行の中央値）")
+    for comparison in sorted(comparisons, key=lambda c: c.stage):
+        unit = "行/秒" if comparison.metric == "rows_per_second" else "秒"
+        message = (
+            f"  {comparison.stage}: {comparison.latest:,.1f} {unit}"
+            f"（基準 {comparison.baseline:,.1f} {unit}, {comparison.change:+.1%}, {comparison.baseline_runs} 回）"
+        )
+        if comparison.regressed:
+            logger.warning(f"{message} ← 低下")
+        else:
+            logger.info(message)
+
+
+def write_prometheus_textfile(
+    recorder: RunRecorder, status: str, comparisons: list[Comparison], output_path: Path
+) -> None:
+    """
+    直近の実行のメトリクスを Prometheus の textfile 形式で出力（node_exporter の textfile collector 用）
+
+    内訳（テーブル単位）は系列数を抑えるため出力しない
+
+    Args:
+        recorder: 実行のメトリクス
+        status: 実行結果
+        comparisons: 過去の実行との比較結果
+        output_path: 出力先 .prom ファイルのパス
+    """
+    stages = [metrics for name, metrics in recorder.stages.items() if "/" not in name]
+    labels = f'command="{recorder.command}"'
+
+    def gauge(name: str, help_text: str, samples: list[tuple[str, Optional[float]]]) -> list[str]:
+        lines = [f"# HELP {METRIC_PREFIX}_{name} {help_text}", f"# TYPE {METRIC_PREFIX}_{name} gauge"]
+        lines += [f"{METRIC_PREFIX}_{name}{{{sample_labels}}} {value}" for sample_labels, value in samples
+                  if value is not None]
+        return lines
+
+    def stage_labels(stage: str) -> str:
+        return f'{labels},stage="{stage}"'
+
+    regressed = {comparison.stage for comparison in comparisons if comparison.regressed}
+    lines = [
+        *gauge("last_run_timestamp_seconds", "Start time of the last run.",
+               [(labels, recorder.started_at.timestamp())]),
+        *gauge("last_run_success", "Whether the last run succeeded.", [(labels, 1.0 if status == "success" else 0.0)]),
+        *gauge("last_run_duration_seconds", "Wall-clock duration of the last run.",
+               [(labels, time.perf_counter() - recorder.started)]),
+        *gauge("stage_duration_seconds", "Processing time of each stage.",
+               [(stage_labels(m.stage), m.seconds) for m in stages]),
+        *gauge("stage_rows", "Rows processed by each stage.",
+               [(stage_labels(m.stage), m.rows) for m in stages]),
+        *gauge("stage_rows_per_second", "Throughput of each stage.",
+               [(stage_labels(m.stage), m.rows_per_second) for m in stages]),
+        *gauge("stage_peak_memory_bytes", "Peak resident memory during each stage.",
+               [(stage_labels(m.stage), m.peak_memory_bytes) for m in stages]),
+        *gauge("stage_regression", "Whether the stage regressed against the rolling baseline.",
+               [(stage_labels(m.stage), 1.0 if m.stage in regressed else 0.0) for m in stages]),
+    ]
+
+    # collector が書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_suffix(f".prom.{os.getpid()}")
+    temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(temp_path, output_path)
+    logger.info(f"Prometheus メトリクスを出力しました: {output_path}")
@@ -0,0 +1,73 @@
+"""
+パイプライン実行モジュール
+
+テーブル構築（生産者）とアップロード（消費者）を別スレッドで並行に実行する
+キューの長さに上限を設け、アップロードが追いつかない場合は構築側を待たせる（バックプレッシャー）
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable, Iterable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 構築済み・未アップロードのまま保持するテーブル数の上限（メモリ使用量の上限）
+QUEUE_SIZE = 2
+
+# キューの終端を表す値
+_SENTINEL = object()
+
+
+def run_pipeline(items: Iterable[T], consume: Callable[[T], None], queue_size: int = QUEUE_SIZE) -> None:
+    """
+    items を生成しながら、生成済みの要素を別スレッドで consume に渡す
+
+    生成側で例外が発生した場合は消費側を停止させてから例外を再送出する
+    消費側で例外が発生した場合は、以降の要素を consume に渡さずに items を最後まで生成してから例外を再送出する
+    （生成側の後処理を完了させるため。構築済みテーブルのキャッシュが揃い、--resume で再開できる）
+
+    Args:
+        items: 要素を順に生成するイテラブル（呼び出し元スレッドで評価）
+        consume: 要素ごとの処理（消費スレッドで実行）
+        queue_size: キューに保持する要素数の上限
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=queue_size)
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        while True:
+            item = buffer.get()
+            if item is _SENTINEL:
+                return
+            if errors:
+                # 失敗後は生成側がブロックしないよう読み捨てる
+                continue
+            try:
+                consume(item)
+            except BaseException as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=worker, name="uploader", daemon=True)
+    thread.start()
+
+    logged = False
+    try:
+        for item in items:
+            if errors:
+                # 失敗後は生成のみ続ける（キューに積まない）
+                if not logged:
+                    logger.warning(f"アップロードに失敗したため、残りのテーブルは構築・保存のみ行います: {errors[0]}")
+                    logged = True
+                continue
+            buffer.put(item)
+            if buffer.full():
+                logger.info("  アップロード待ち（キュー満杯）")
+    finally:
+        buffer.put(_SENTINEL)
+        thread.join()
+
+    if errors:
+        raise errors[0]
@@ -0,0 +1,288 @@
+"""
+支出先名寄せモジュール
+
+expenditures の支出先（支出先名・法人番号）の表記ゆれをクラスタリングし、支出先IDを付与する
+
+1. 法人番号が同じ支出先を同一とみなす
+2. 正規化した名称（法人格の除去など）が一致する支出先を同一とみなす
+3. MinHash-LSH で候補を絞り込み、文字 bigram の Jaccard 係数が閾値以上の支出先を同一とみなす
+
+異なる法人番号を持つ支出先同士は統合しない
+"""
+
+import hashlib
+import logging
+import re
+import zlib
+from collections import Counter, defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import normalize
+
+logger = logging.getLogger(__name__)
+
+# 名寄せ時に除去する法人格の表記
+CORPORATE_FORMS = [
+    "株式会社", "有限会社", "合同会社", "合資会社", "合名会社",
+    "一般社団法人", "公益社団法人", "一般財団法人", "公益財団法人",
+    "国立研究開発法人", "独立行政法人", "地方独立行政法人", "国立大学法人", "公立大学法人",
+    "学校法人", "社会福祉法人", "医療法人", "特定非営利活動法人", "npo法人",
+    "(株)", "(有)", "(同)", "(一社)", "(公社)", "(一財)", "(公財)", "(独)", "(学)", "(福)", "(医)", "(特非)",
+    "㈱", "㈲",
+]
+
+# 名寄せキーから除去する記号・空白
+_SYMBOL_PATTERN = re.compile(r"[\s・･.,、。\-‐－―()（）「」『』\[\]【】]")
+
+# MinHash のハッシュ関数の数と LSH のバンド数（1 バンド = 4 行、類似度 0.5 付近から候補化）
+NUM_PERMUTATIONS = 64
+NUM_BANDS = 16
+
+# 候補ペアを同一とみなす Jaccard 係数の閾値
+SIMILARITY_THRESHOLD = 0.8
+
+# あいまい一致の対象とする名寄せキーの最小文字数（短い名称は完全一致のみ）
+MIN_FUZZY_LENGTH = 4
+
+# 候補ペアを作るバケットの最大要素数（ありふれた名称による候補爆発の防止。1 バケットの候補ペアは最大 4,950）
+MAX_BUCKET_SIZE = 100
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_recipient_name(name: Optional[str]) -> Optional[str]:
+    """
+    支出先名を名寄せキーに変換
+
+    - neologdn による正規化
+    - 小文字化
+    - 法人格（株式会社、(株) など）の除去
+    - 記号・空白の除去
+    """
+    if name is None or pd.isna(name):
+        return None
+
+    key = (normalize(str(name)) or "").lower()
+    for form in CORPORATE_FORMS:
+        key = key.replace(form, "")
+    key = _SYMBOL_PATTERN.sub("", key)
+
+    return key or None
+
+
+def normalize_corporate_number(value: Optional[str]) -> Optional[str]:
+    """法人番号を 13 桁の数字に揃える（不正な値は None）"""
+    if value is None or pd.isna(value):
+        return None
+    digits = re.sub(r"\D", "", str(value))
+    return digits if len(digits) == 13 else None
+
+
+class _UnionFind:
+    """法人番号の衝突を避ける Union-Find"""
+
+    def __init__(self, corporate_numbers: list[Optional[str]]):
+        self.parent = list(range(len(corporate_numbers)))
+        self.corporate_number = list(corporate_numbers)
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j:
+            return False
+
+        number_i, number_j = self.corporate_number[root_i], self.corporate_number[root_j]
+        if number_i is not None and number_j is not None and number_i != number_j:
+            return False
+
+        self.parent[root_j] = root_i
+        self.corporate_number[root_i] = number_i or number_j
+        return True
+
+
+def _shingles(key: str) -> set[str]:
+    """名寄せキーの文字 bigram 集合"""
+    if len(key) < 2:
+        return {key}
+    return {key[i:i + 2] for i in range(len(key) - 1)}
+
+
+def _minhash_candidates(keys: list[str]) -> set[tuple[int, int]]:
+    """
+    MinHash-LSH で類似候補ペアを抽出
+
+    全ペア比較（O(n²)）を避けるため、署名のバンドが一致するキー同士のみを候補とする
+    """
+    shingle_sets = [_shingles(key) for key in keys]
+    owners = np.repeat(np.arange(len(keys)), [len(shingles) for shingles in shingle_sets])
+    if len(owners) == 0:
+        return set()
+
+    # プロセスに依存しないハッシュ値（crc32）を使用
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingles in shingle_sets for shingle in shingles),
+        dtype=np.uint64, count=len(owners)
+    )
+    starts = np.concatenate([[0], np.cumsum([len(shingles) for shingles in shingle_sets])[:-1]])
+
+    rng = np.random.default_rng(0)
+    a = rng.integers(1, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+    b = rng.integers(0, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+    signatures = np.empty((len(keys), NUM_PERMUTATIONS), dtype=np.uint64)
+    for k in range(NUM_PERMUTATIONS):
+        values = (a[k] * hashes + b[k]) % _MERSENNE_PRIME
+        signatures[:, k] = np.minimum.reduceat(values, starts)
+
+    rows_per_band = NUM_PERMUTATIONS // NUM_BANDS
+    candidates = set()
+    for band in range(NUM_BANDS):
+        # バンド内の署名を 1 つのハッシュ値にまとめ、ソートして同一バケットの連続区間を得る
+        bucket_hashes = np.zeros(len(keys), dtype=np.uint64)
+        for k in range(band * rows_per_band, (band + 1) * rows_per_band):
+            bucket_hashes = bucket_hashes * np.uint64(1000003) ^ signatures[:, k]
+
+        order = np.argsort(bucket_hashes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(bucket_hashes[order])) + 1
+        for start, end in zip(np.concatenate([[0], boundaries]), np.concatenate([boundaries, [len(keys)]])):
+            if 1 < end - start <= MAX_BUCKET_SIZE:
+                # バケット内の全ペアを候補にする（先頭の要素とのペアのみでは、先頭以外の類似ペアを取りこぼす）
+                members = sorted(int(i) for i in order[start:end])
+                candidates.update(combinations(members, 2))
+
+    return candidates
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b)
+
+
+def resolve_recipients(df: pd.DataFrame, report_path: Optional[Path] = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    expenditures の支出先を名寄せし、支出先IDを付与
+
+    Args:
+        df: expenditures テーブルの DataFrame
+        report_path: 統合されたクラスタの一覧を出力する CSV のパス（None の場合は出力しない）
+
+    Returns:
+        (recipient_id を追加した expenditures, recipients テーブル)
+    """
+    logger.info("支出先の名寄せ中...")
+
+    names = df["recipient_name"].astype(object).where(df["recipient_name"].notna(), None)
+    numbers = df["corporate_number"].map(normalize_corporate_number)
+
+    # 支出先（支出先名 × 法人番号）の組み合わせ単位で処理
+    pairs = pd.DataFrame({"recipient_name": names, "corporate_number": numbers})
+    pairs = pairs[names.notna() | numbers.notna()]
+    record_counts = Counter(pairs.itertuples(index=False, name=None))
+    entities = list(record_counts)
+    keys = [normalize_recipient_name(name) or number for name, number in entities]
+    logger.info(f"  支出先の組み合わせ: {len(entities):,} 件（{len(pairs):,} 行）")
+
+    # 名寄せキーが空になる支出先名（"-" などの仮の名称・法人格のみ）で法人番号もない支出先は名寄せしない（支出先IDは NULL）
+    unresolved = [entity for entity, key in zip(entities, keys) if key is None]
+    if unresolved:
+        entities = [entity for entity, key in zip(entities, keys) if key is not None]
+        keys = [key for key in keys if key is not None]
+        logger.info(
+            f"  名寄せの対象外: {len(unresolved):,} 件（{sum(record_counts[entity] for entity in unresolved):,} 行）"
+        )
+
+    uf = _UnionFind([number for _, number in entities])
+
+    # 1. 法人番号が一致
+    by_number = defaultdict(list)
+    for i, (_, number) in enumerate(entities):
+        if number is not None:
+            by_number[number].append(i)
+    for members in by_number.values():
+        for other in members[1:]:
+            uf.union(members[0], other)
+
+    # 2. 名寄せキーが一致（複数の法人番号が同じキーを持つ場合、法人番号なしの支出先は統合しない）
+    by_key = defaultdict(list)
+    for i, key in enumerate(keys):
+        by_key[key].append(i)
+    for members in by_key.values():
+        if len({entities[i][1] for i in members} - {None}) > 1:
+            members = [i for i in members if entities[i][1] is None]
+        for other in members[1:]:
+            uf.union(members[0], other)
+
+    # 3. MinHash-LSH による類似キーの統合（キー単位で比較）
+    fuzzy_keys = [key for key in by_key if len(key) >= MIN_FUZZY_LENGTH]
+    shingle_sets = [_shingles(key) for key in fuzzy_keys]
+    merged = 0
+    for i, j in _minhash_candidates(fuzzy_keys):
+        if _jaccard(shingle_sets[i], shingle_sets[j]) >= SIMILARITY_THRESHOLD:
+            merged += uf.union(by_key[fuzzy_keys[i]][0], by_key[fuzzy_keys[j]][0])
+    logger.info(f"  あいまい一致による統合: {merged:,} 件")
+
+    # クラスタごとに代表名称と支出先IDを決定
+    clusters = defaultdict(list)
+    for i in range(len(entities)):
+        clusters[uf.find(i)].append(i)
+
+    entity_ids = {}
+    recipients = []
+    report = []
+    for root, members in clusters.items():
+        number = uf.corporate_number[root]
+        name_counts = Counter()
+        for i in members:
+            if entities[i][0] is not None:
+                name_counts[entities[i][0]] += record_counts[entities[i]]
+        canonical_name = min(name_counts, key=lambda name: (-name_counts[name], name)) if name_counts else None
+
+        if number is not None:
+            recipient_id = number
+        else:
+            canonical_key = min((keys[i] for i in members), key=lambda key: (-len(by_key[key]), key))
+            recipient_id = "N" + hashlib.sha1(canonical_key.encode("utf-8")).hexdigest()[:16]
+
+        for i in members:
+            entity_ids[entities[i]] = recipient_id
+
+        recipients.append({
+            "recipient_id": recipient_id,
+            "canonical_name": canonical_name,
+            "corporate_number": number,
+            "name_variants": len(name_counts),
+            "record_count": sum(record_counts[entities[i]] for i in members),
+        })
+        if len(name_counts) > 1:
+            for name, count in name_counts.most_common():
+                report.append({"recipient_id": recipient_id, "canonical_name": canonical_name,
+                               "recipient_name": name, "record_count": count})
+
+    result = df.copy()
+    result["recipient_id"] = [
+        entity_ids.get((name, number)) for name, number in zip(names, numbers)
+    ]
+
+    df_recipients = pd.DataFrame(recipients).drop_duplicates(subset=["recipient_id"])
+    df_recipients["name_variants"] = df_recipients["name_variants"].astype("Int64")
+    df_recipients["record_count"] = df_recipients["record_count"].astype("Int64")
+
+    merged_clusters = len({row["recipient_id"] for row in report})
+    logger.info(f"  支出先ID: {len(df_recipients):,} 件（表記ゆれを統合したクラスタ: {merged_clusters:,} 件）")
+
+    if report_path is not None:
+        pd.DataFrame(report, columns=["recipient_id", "canonical_name", "recipient_name", "record_count"]).to_csv(
+            report_path, index=False, encoding="utf-8-sig"
+        )
+        logger.info(f"  名寄せレポートを出力しました: {report_path}")
+
+    return result, df_recipients
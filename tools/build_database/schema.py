@@ -0,0 +1,135 @@
+"""
+スキーマ定義モジュール
+
+supabase/seed.sql からテーブル定義（カラム名・SQL 型・論理名・主キー）と外部キー制約を読み込む
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SEED_SQL_PATH = Path(__file__).resolve().parent.parent.parent / "supabase" / "seed.sql"
+
+# テーブルの論理名
+TABLE_LOGICAL_NAMES = {
+    "projects_master": "事業の基本情報マスタ",
+    "policies": "政策・施策の詳細",
+    "laws": "法令の詳細",
+    "subsidies": "補助率の詳細",
+    "related_projects": "関連事業の詳細",
+    "project_lineage": "事業の系譜（年度をまたいだ同一事業）",
+    "budgets": "予算・執行のサマリ",
+    "budget_items": "歳出予算項目の詳細",
+    "budget_cube": "予算の事前集計（府省庁・局・庁・会計区分・項別）",
+    "expenditures": "支出先情報",
+    "expenditure_flows": "支出先ブロックの資金の流れ",
+    "expenditure_usages": "費目・使途の詳細",
+    "expenditure_contracts": "国庫債務負担行為等の契約情報",
+    "recipients": "支出先（名寄せ済み）",
+    "texts": "長文テキスト（重複排除済み）",
+    "catalog": "テーブル・カラムの統計情報カタログ",
+}
+
+# 数値として扱う SQL 型
+NUMERIC_TYPES = {"BIGINT", "INTEGER", "SMALLINT", "NUMERIC", "REAL", "DOUBLE PRECISION"}
+
+_CREATE_TABLE_PATTERN = re.compile(r'CREATE TABLE IF NOT EXISTS "(\w+)" \((.*?)\n\);', re.DOTALL)
+_COLUMN_PATTERN = re.compile(r'^\s*"(\w+)"\s+([A-Z][A-Z ]*?)\s*,?\s*(?:--\s*(.*))?$')
+_PRIMARY_KEY_PATTERN = re.compile(r'PRIMARY KEY \(([^)]*)\)')
+_FOREIGN_KEY_PATTERN = re.compile(
+    r'ALTER TABLE (\w+)\s+ADD CONSTRAINT \w+\s+FOREIGN KEY \(([^)]*)\)\s+REFERENCES (\w+)\(([^)]*)\)'
+)
+
+
+@dataclass
+class ColumnDefinition:
+    """カラム定義"""
+    name: str
+    data_type: str
+    logical_name: str
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.data_type in NUMERIC_TYPES
+
+
+@dataclass
+class TableDefinition:
+    """テーブル定義"""
+    name: str
+    logical_name: str
+    columns: list[ColumnDefinition] = field(default_factory=list)
+    primary_keys: list[str] = field(default_factory=list)
+
+    @property
+    def column_names(self) -> list[str]:
+        return [column.name for column in self.columns]
+
+
+@dataclass
+class ForeignKeyDefinition:
+    """外部キー制約の定義"""
+    table_name: str
+    columns: list[str]
+    referenced_table_name: str
+    referenced_columns: list[str]
+
+
+def load_table_definitions(seed_path: Path = SEED_SQL_PATH) -> dict[str, TableDefinition]:
+    """
+    seed.sql の CREATE TABLE 文からテーブル定義を読み込む
+
+    Args:
+        seed_path: seed.sql のパス
+
+    Returns:
+        テーブル名をキー、TableDefinition を値とする辞書（seed.sql の記述順）
+    """
+    sql = seed_path.read_text(encoding="utf-8")
+
+    definitions = {}
+    for table_name, body in _CREATE_TABLE_PATTERN.findall(sql):
+        definition = TableDefinition(
+            name=table_name,
+            logical_name=TABLE_LOGICAL_NAMES.get(table_name, table_name),
+        )
+
+        for line in body.splitlines():
+            primary_key = _PRIMARY_KEY_PATTERN.search(line)
+            if primary_key:
+                definition.primary_keys = [key.strip().strip('"') for key in primary_key.group(1).split(",")]
+                continue
+
+            column = _COLUMN_PATTERN.match(line)
+            if column:
+                name, data_type, comment = column.groups()
+                definition.columns.append(ColumnDefinition(
+                    name=name,
+                    data_type=data_type.strip(),
+                    logical_name=(comment or "").strip() or name,
+                ))
+
+        definitions[table_name] = definition
+
+    return definitions
+
+
+def load_foreign_keys(seed_path: Path = SEED_SQL_PATH) -> list[ForeignKeyDefinition]:
+    """
+    seed.sql の ALTER TABLE ... FOREIGN KEY 文から外部キー制約を読み込む
+
+    Args:
+        seed_path: seed.sql のパス
+
+    Returns:
+        外部キー制約の定義のリスト（seed.sql の記述順）
+    """
+    sql = seed_path.read_text(encoding="utf-8")
+
+    def split(columns: str) -> list[str]:
+        return [column.strip().strip('"') for column in columns.split(",")]
+
+    return [
+        ForeignKeyDefinition(table_name, split(columns), referenced_table_name, split(referenced_columns))
+        for table_name, columns, referenced_table_name, referenced_columns in _FOREIGN_KEY_PATTERN.findall(sql)
+    ]
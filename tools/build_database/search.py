@@ -0,0 +1,188 @@
+"""
+全文検索インデックスモジュール
+
+事業の説明文（事業名・事業の目的・現状・課題・事業の概要）と支出先の契約概要から
+事業単位の bigram 転置インデックスを構築し、組み込みデータベースに格納する
+テキストID で参照する長文は texts テーブルのテキストに置き換えて索引付けする
+
+Postgres（Supabase）側は seed.sql の pg_trgm GIN インデックスで同等の検索を高速化する
+"""
+
+import logging
+import math
+from collections import Counter, defaultdict
+from typing import Optional
+
+import pandas as pd
+
+from .common import normalize
+from .schema import ColumnDefinition, TableDefinition
+from .spec import TABLE_SPECS
+from .texts import TEXTS_TABLE
+
+logger = logging.getLogger(__name__)
+
+# 検索対象カラム（テーブル名 → カラム名のリスト）
+SEARCH_COLUMNS = {
+    "projects_master": ["project_name", "purpose_text_id", "current_issues_text_id", "overview_text_id"],
+    "expenditures": ["contract_summary"],
+}
+
+# 組み込みデータベースに格納する検索インデックスのテーブル定義
+SEARCH_TABLE_DEFINITIONS = {
+    "search_documents": TableDefinition(
+        name="search_documents",
+        logical_name="全文検索の対象文書（事業）",
+        columns=[
+            ColumnDefinition("doc_id", "BIGINT", "文書ID"),
+            ColumnDefinition("project_year", "BIGINT", "事業年度"),
+            ColumnDefinition("project_id", "TEXT", "予算事業ID"),
+            ColumnDefinition("length", "BIGINT", "文書長（文字数）"),
+        ],
+        primary_keys=["doc_id"],
+    ),
+    "search_postings": TableDefinition(
+        name="search_postings",
+        logical_name="全文検索の転置インデックス（bigram）",
+        columns=[
+            ColumnDefinition("gram", "TEXT", "bigram"),
+            ColumnDefinition("doc_id", "BIGINT", "文書ID"),
+            ColumnDefinition("tf", "BIGINT", "出現回数"),
+        ],
+        primary_keys=["gram", "doc_id"],
+    ),
+}
+
+
+def _prepare_text(text: Optional[str]) -> str:
+    """検索用にテキストを正規化（neologdn 正規化 + 小文字化）"""
+    if text is None or pd.isna(text):
+        return ""
+    return (normalize(str(text)) or "").lower()
+
+
+def _bigrams(text: str) -> list[str]:
+    """
+    テキストを bigram に分割
+
+    末尾に空白を付与し、1 文字のクエリも前方一致で検索できるようにする
+    """
+    text = text + " "
+    return [text[i:i + 2] for i in range(len(text) - 1) if not text[i].isspace()]
+
+
+def build_search_index(tables: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """
+    事業単位の bigram 転置インデックスを構築
+
+    Args:
+        tables: テーブル名をキー、DataFrame を値とする辞書（projects_master は必須。長文の参照には texts を使用）
+
+    Returns:
+        search_documents / search_postings テーブルの辞書
+    """
+    logger.info("全文検索インデックス構築中...")
+
+    keys = ["project_year", "project_id"]
+
+    # テキストID → テキスト
+    text_table = tables.get(TEXTS_TABLE)
+    text_lookup = dict(zip(text_table["text_id"], text_table["text"])) if text_table is not None else {}
+    text_id_columns = {spec.name: set(spec.text_id_columns) for spec in TABLE_SPECS}
+
+    # 事業ごとに検索対象テキストを連結
+    texts: dict[tuple, list[str]] = defaultdict(list)
+    for table_name, columns in SEARCH_COLUMNS.items():
+        df = tables.get(table_name)
+        if df is None:
+            continue
+        df = df[keys + columns].copy()
+        for column in text_id_columns.get(table_name, set()) & set(columns):
+            df[column] = df[column].map(text_lookup)
+        for row in df.itertuples(index=False, name=None):
+            texts[row[:2]].extend(value for value in row[2:] if isinstance(value, str))
+
+    projects = tables["projects_master"][keys].drop_duplicates()
+
+    documents = []
+    postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for doc_id, (project_year, project_id) in enumerate(projects.itertuples(index=False, name=None)):
+        text = "\n".join(_prepare_text(value) for value in texts.get((project_year, project_id), []))
+        documents.append((doc_id, project_year, project_id, len(text)))
+        for gram, tf in Counter(_bigrams(text)).items():
+            postings[gram].append((doc_id, tf))
+
+    df_documents = pd.DataFrame(documents, columns=SEARCH_TABLE_DEFINITIONS["search_documents"].column_names)
+    df_postings = pd.DataFrame(
+        [(gram, doc_id, tf) for gram, entries in postings.items() for doc_id, tf in entries],
+        columns=SEARCH_TABLE_DEFINITIONS["search_postings"].column_names
+    )
+
+    logger.info(f"  search_documents: {len(df_documents):,} 件, search_postings: {len(df_postings):,} 件 ({len(postings):,} bigram)")
+
+    return {"search_documents": df_documents, "search_postings": df_postings}
+
+
+def search_projects(con, query: str, limit: int = 20) -> list[tuple[int, str, float]]:
+    """
+    全文検索インデックスから事業を検索
+
+    クエリの全 bigram を含む事業を tf-idf の合計でランク付けして返す
+    （bigram の一致で判定するため、まれに部分文字列として連続しない一致を含む）
+
+    Args:
+        con: 組み込みデータベースへの接続（sqlite3 / duckdb）
+        query: 検索キーワード
+        limit: 返却件数の上限
+
+    Returns:
+        (事業年度, 予算事業ID, スコア) のリスト（スコア降順）
+    """
+    text = _prepare_text(query).strip()
+    if not text:
+        return []
+
+    # 1 文字のクエリは bigram の前方一致で検索
+    if len(text) == 1:
+        grams = {row[0] for row in con.execute(
+            "SELECT DISTINCT gram FROM search_postings WHERE gram >= ? AND gram < ?",
+            [text, text + "\uffff"]
+        ).fetchall()}
+        match_all = False
+    else:
+        grams = set(_bigrams(text)[:-1])
+        match_all = True
+
+    num_documents = con.execute("SELECT COUNT(*) FROM search_documents").fetchone()[0]
+
+    scores: Optional[dict[int, float]] = None
+    for gram in grams:
+        entries = con.execute("SELECT doc_id, tf FROM search_postings WHERE gram = ?", [gram]).fetchall()
+        if not entries and match_all:
+            return []
+
+        idf = math.log(1 + num_documents / max(len(entries), 1))
+        gram_scores = {doc_id: tf * idf for doc_id, tf in entries}
+
+        if scores is None:
+            scores = gram_scores
+        elif match_all:
+            scores = {doc_id: score + gram_scores[doc_id] for doc_id, score in scores.items() if doc_id in gram_scores}
+        else:
+            for doc_id, score in gram_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+    if not scores:
+        return []
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    placeholders = ", ".join("?" * len(ranked))
+    projects = {
+        doc_id: (project_year, project_id)
+        for doc_id, project_year, project_id in con.execute(
+            f"SELECT doc_id, project_year, project_id FROM search_documents WHERE doc_id IN ({placeholders})",
+            [doc_id for doc_id, _ in ranked]
+        ).fetchall()
+    }
+
+    return [(*projects[doc_id], score) for doc_id, score in ranked]
@@ -0,0 +1,52 @@
+"""
+JSON シリアライズモジュール
+
+アップロード用にテーブルをバッチ単位の JSON バイト列に変換する
+
+df.to_dict('records') でテーブル全体の辞書を一度に作らず、バッチごとにカラムの配列から
+必要な行だけを取り出して orjson でエンコードする
+欠損値（None / NaN / pd.NA / NaT）はすべて JSON の null に変換する
+"""
+
+from typing import Iterator
+
+import orjson
+import pandas as pd
+
+
+def _column_values(series: pd.Series) -> list:
+    """カラムの値を Python のリストに変換（欠損値は None）"""
+    return series.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def encode_batch(df: pd.DataFrame) -> bytes:
+    """
+    DataFrame（1 バッチ分）を JSON 配列のバイト列にエンコード
+
+    Args:
+        df: 対象 DataFrame
+
+    Returns:
+        [{"column": value, ...}, ...] 形式の JSON バイト列
+    """
+    columns = list(df.columns)
+    values = [_column_values(df[column]) for column in columns]
+    records = [dict(zip(columns, row)) for row in zip(*values)]
+    return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def iter_json_batches(df: pd.DataFrame, batch_size: int, start_batch: int = 0) -> Iterator[tuple[int, bytes]]:
+    """
+    DataFrame をバッチ単位の JSON バイト列として順に返す
+
+    Args:
+        df: 対象 DataFrame
+        batch_size: 1 バッチの行数
+        start_batch: 開始バッチ番号（再開時）
+
+    Yields:
+        (バッチ番号, JSON バイト列)
+    """
+    total_batches = (len(df) + batch_size - 1) // batch_size
+    for batch_index in range(start_batch, total_batches):
+        yield batch_index, encode_batch(df.iloc[batch_index * batch_size:(batch_index + 1) * batch_size])
@@ -0,0 +1,452 @@
+"""
+カラム対応定義モジュール
+
+CSV のカラムとテーブルのカラムの対応（カラム名・SQL 型・正規化の有無・主キー・連番の採番単位）を
+テーブルごとに宣言的に定義する
+テーブル構築（common.build_table）、セクションの構築順、supabase/seed.sql の CREATE TABLE 文はこの定義から生成する
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# 事業を識別する CSV のカラム（全 CSV に共通）
+PROJECT_KEY_SOURCES = ("事業年度", "予算事業ID")
+
+# CREATE TABLE 文のカラムコメントの開始位置（セクションごと）
+SECTION_COMMENT_COLUMNS = {
+    "基本情報": 38,
+    "予算・執行": 38,
+    "支出先": 42,
+}
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """テーブルのカラム定義"""
+    name: str
+    # CSV のカラム名（None の場合は構築時に生成: seq_no は連番、それ以外は後続の処理で付与）
+    source: Optional[str]
+    data_type: str = "TEXT"
+    # 論理名（None の場合は CSV のカラム名）
+    logical_name: Optional[str] = None
+    # neologdn による正規化を行うか
+    normalize: bool = False
+    # 長文として texts テーブルに 1 度だけ格納し、テキストID で参照するか（サニタイズし、normalize の場合は正規化して格納する）
+    deduplicate: bool = False
+
+    @property
+    def comment(self) -> Optional[str]:
+        return self.logical_name or self.source
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """テーブル定義"""
+    name: str
+    section: str
+    # CSV ファイル名（拡張子なし）。複数の場合は事業年度・予算事業ID で内部結合（各 CSV の先頭行のみ使用）
+    sources: tuple[str, ...]
+    columns: tuple[ColumnSpec, ...]
+    primary_keys: tuple[str, ...]
+    # このカラム（CSV のカラム名）が空の行は除外
+    required: Optional[str] = None
+    # seq_no を採番する単位（CSV のカラム名）。空の場合は採番しない
+    seq_no_keys: tuple[str, ...] = ()
+
+    @property
+    def source_columns(self) -> list[str]:
+        """テーブル構築に使用する CSV のカラム"""
+        names = [column.source for column in self.columns if column.source]
+        for name in (*PROJECT_KEY_SOURCES, *self.seq_no_keys, *([self.required] if self.required else [])):
+            if name not in names:
+                names.append(name)
+        return names
+
+    @property
+    def normalize_sources(self) -> set[str]:
+        """正規化対象の CSV のカラム"""
+        return {column.source for column in self.columns if column.normalize and column.source}
+
+    @property
+    def text_sources(self) -> set[str]:
+        """texts テーブルに格納する長文の CSV のカラム"""
+        return {column.source for column in self.columns if column.deduplicate and column.source}
+
+    @property
+    def text_id_columns(self) -> list[str]:
+        """テキストID で参照するカラム"""
+        return [column.name for column in self.columns if column.deduplicate]
+
+
+def _project_keys() -> tuple[ColumnSpec, ...]:
+    """主キーの事業年度・予算事業ID"""
+    return (
+        ColumnSpec("project_year", "事業年度", "BIGINT"),
+        ColumnSpec("project_id", "予算事業ID"),
+    )
+
+
+# ============================================================
+# 基本情報セクション（1-*.csv）
+# ============================================================
+
+PROJECTS_MASTER = TableSpec(
+    name="projects_master",
+    section="基本情報",
+    sources=("1-1_RS_2024_基本情報_組織情報", "1-2_RS_2024_基本情報_事業概要等"),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("project_name", "事業名", normalize=True),
+        ColumnSpec("ministry", "府省庁", normalize=True),
+        ColumnSpec("bureau", "局・庁", normalize=True),
+        ColumnSpec("department", "部", normalize=True),
+        ColumnSpec("division", "課", normalize=True),
+        ColumnSpec("section", "室", normalize=True),
+        ColumnSpec("unit", "班", normalize=True),
+        ColumnSpec("project_group", "係", normalize=True),
+        ColumnSpec("creator", "作成責任者", normalize=True),
+        ColumnSpec("purpose_text_id", "事業の目的", logical_name="事業の目的（texts.text_id）", normalize=True, deduplicate=True),
+        ColumnSpec("current_issues_text_id", "現状・課題", logical_name="現状・課題（texts.text_id）", normalize=True, deduplicate=True),
+        ColumnSpec("overview_text_id", "事業の概要", logical_name="事業の概要（texts.text_id）", normalize=True, deduplicate=True),
+        ColumnSpec("overview_url", "事業概要URL"),
+        ColumnSpec("project_category", "事業区分"),
+        ColumnSpec("start_year", "事業開始年度"),
+        ColumnSpec("start_year_unknown", "開始年度不明"),
+        ColumnSpec("end_year", "事業終了（予定）年度"),
+        ColumnSpec("end_year_indefinite", "終了予定なし"),
+        ColumnSpec("major_expense", "主要経費"),
+        ColumnSpec("remarks", "備考", normalize=True),
+        ColumnSpec("impl_direct", "実施方法ー直接実施"),
+        ColumnSpec("impl_subsidy", "実施方法ー補助"),
+        ColumnSpec("impl_burden", "実施方法ー負担"),
+        ColumnSpec("impl_grant", "実施方法ー交付"),
+        ColumnSpec("impl_contribution", "実施方法ー分担金・拠出金"),
+        ColumnSpec("impl_other", "実施方法ーその他"),
+        ColumnSpec("old_project_number", "旧事業番号"),
+    ),
+    primary_keys=("project_year", "project_id"),
+)
+
+POLICIES = TableSpec(
+    name="policies",
+    section="基本情報",
+    sources=("1-3_RS_2024_基本情報_政策・施策、法令等",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT", logical_name="番号（政策・施策）"),
+        ColumnSpec("policy_ministry", "政策所管府省庁_P"),
+        ColumnSpec("policy_name", "政策", normalize=True),
+        ColumnSpec("measure_name", "施策", normalize=True),
+        ColumnSpec("policy_url", "政策・施策URL"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    required="政策",
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+LAWS = TableSpec(
+    name="laws",
+    section="基本情報",
+    sources=("1-3_RS_2024_基本情報_政策・施策、法令等",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT", logical_name="番号（根拠法令）"),
+        ColumnSpec("law_name", "法令名", normalize=True),
+        ColumnSpec("law_number", "法令番号"),
+        ColumnSpec("law_id", "法令ID"),
+        ColumnSpec("article", "条"),
+        ColumnSpec("law_paragraph", "項"),
+        ColumnSpec("law_item_subdivision", "号・号の細分"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    required="法令名",
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+SUBSIDIES = TableSpec(
+    name="subsidies",
+    section="基本情報",
+    sources=("1-4_RS_2024_基本情報_補助率等",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", "番号（補助率等）", "BIGINT"),
+        ColumnSpec("subsidy_target", "補助対象", normalize=True),
+        ColumnSpec("subsidy_rate", "補助率", normalize=True),
+        ColumnSpec("subsidy_cap", "補助上限等", normalize=True),
+        ColumnSpec("subsidy_url", "補助率URL"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    required="番号（補助率等）",
+)
+
+RELATED_PROJECTS = TableSpec(
+    name="related_projects",
+    section="基本情報",
+    sources=("1-5_RS_2024_基本情報_関連事業",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", "番号（関連事業）", "BIGINT"),
+        ColumnSpec("related_project_id", "関連事業の事業ID"),
+        ColumnSpec("related_project_name", "関連事業の事業名", normalize=True),
+        ColumnSpec("relation_type", "関連性", normalize=True),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    required="関連事業の事業ID",
+)
+
+BASIC_INFO_TABLES = (PROJECTS_MASTER, POLICIES, LAWS, SUBSIDIES, RELATED_PROJECTS)
+
+# ============================================================
+# 予算・執行セクション（2-*.csv）
+# ============================================================
+
+_BUDGET_KEYS = (
+    *_project_keys(),
+    ColumnSpec("budget_year", "予算年度", "BIGINT"),
+    ColumnSpec("seq_no", None, "BIGINT"),
+    ColumnSpec("account_category", "会計区分"),
+    ColumnSpec("account", "会計", normalize=True),
+    ColumnSpec("sub_account", "勘定", normalize=True),
+)
+
+BUDGETS = TableSpec(
+    name="budgets",
+    section="予算・執行",
+    sources=("2-1_RS_2024_予算・執行_サマリ",),
+    columns=(
+        *_BUDGET_KEYS,
+        ColumnSpec("initial_budget", "当初予算"),
+        ColumnSpec("supplementary_budget_1", "第1次補正予算"),
+        ColumnSpec("supplementary_budget_2", "第2次補正予算"),
+        ColumnSpec("supplementary_budget_3", "第3次補正予算"),
+        ColumnSpec("supplementary_budget_4", "第4次補正予算"),
+        ColumnSpec("supplementary_budget_5", "第5次補正予算"),
+        ColumnSpec("carryover_from_prev", "前年度から繰越し"),
+        ColumnSpec("reserve_fund_1", "予備費等1"),
+        ColumnSpec("reserve_fund_2", "予備費等2"),
+        ColumnSpec("reserve_fund_3", "予備費等3"),
+        ColumnSpec("reserve_fund_4", "予備費等4"),
+        ColumnSpec("current_budget", "歳出予算現額"),
+        ColumnSpec("execution_amount", "執行額"),
+        ColumnSpec("execution_rate", "執行率"),
+        ColumnSpec("carryover_to_next", "翌年度への繰越し(合計）"),
+        ColumnSpec("next_year_request", "翌年度要求額"),
+        ColumnSpec("requested_amount", "要望額"),
+        ColumnSpec("increase_reason", "主な増減理由", normalize=True),
+        ColumnSpec("special_notes", "その他特記事項", normalize=True),
+        ColumnSpec("remarks", "備考", normalize=True),
+    ),
+    primary_keys=("project_year", "project_id", "budget_year", "seq_no"),
+    seq_no_keys=(*PROJECT_KEY_SOURCES, "予算年度"),
+)
+
+BUDGET_ITEMS = TableSpec(
+    name="budget_items",
+    section="予算・執行",
+    sources=("2-2_RS_2024_予算・執行_予算種別・歳出予算項目",),
+    columns=(
+        *_BUDGET_KEYS,
+        ColumnSpec("budget_type", "予算種別"),
+        ColumnSpec("jurisdiction", "所管", normalize=True),
+        ColumnSpec("organization", "組織・勘定", normalize=True),
+        ColumnSpec("budget_item", "項", normalize=True),
+        ColumnSpec("category", "目", normalize=True),
+        ColumnSpec("supplement_info", "歳出予算項目の補足情報", normalize=True),
+        ColumnSpec("budget_amount", "予算額（歳出予算項目ごと）"),
+        ColumnSpec("next_year_request", "翌年度要求額（歳出予算項目ごと）"),
+        ColumnSpec("remarks", "備考（歳出予算項目ごと）", normalize=True),
+    ),
+    primary_keys=("project_year", "project_id", "budget_year", "seq_no"),
+    seq_no_keys=(*PROJECT_KEY_SOURCES, "予算年度"),
+)
+
+BUDGET_EXECUTION_TABLES = (BUDGETS, BUDGET_ITEMS)
+
+# ============================================================
+# 支出先セクション（5-*.csv）
+# ============================================================
+
+_CONTRACT_SUFFIX = "（国庫債務負担行為等による契約）"
+
+EXPENDITURES = TableSpec(
+    name="expenditures",
+    section="支出先",
+    sources=("5-1_RS_2024_支出先_支出情報",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT"),
+        ColumnSpec("block_number", "支出先ブロック番号"),
+        ColumnSpec("block_name", "支出先ブロック名", normalize=True),
+        ColumnSpec("num_recipients", "支出先の数"),
+        ColumnSpec("role", "事業を行う上での役割", normalize=True),
+        ColumnSpec("block_total_amount", "ブロックの合計支出額"),
+        ColumnSpec("recipient_name", "支出先名", normalize=True),
+        ColumnSpec("corporate_number", "法人番号"),
+        ColumnSpec("location", "所在地", normalize=True),
+        ColumnSpec("corporate_type", "法人種別", normalize=True),
+        ColumnSpec("other_recipient", "その他支出先"),
+        ColumnSpec("recipient_total_amount", "支出先の合計支出額"),
+        ColumnSpec("contract_summary", "契約概要", normalize=True),
+        ColumnSpec("amount", "金額"),
+        ColumnSpec("contract_method", "契約方式等", normalize=True),
+        ColumnSpec("specific_contract_method", "具体的な契約方式等", normalize=True),
+        ColumnSpec("num_bidders", "入札者数"),
+        ColumnSpec("bid_rate", "落札率"),
+        ColumnSpec(
+            "sole_bid_reason_text_id",
+            "一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）",
+            logical_name="一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（支出額10億円以上）（texts.text_id）",
+            normalize=True,
+            deduplicate=True,
+        ),
+        ColumnSpec("other_contract", "その他の契約"),
+        # 支出先の名寄せ（recipients.py）で付与
+        ColumnSpec("recipient_id", None, logical_name="支出先ID（名寄せ）"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+EXPENDITURE_FLOWS = TableSpec(
+    name="expenditure_flows",
+    section="支出先",
+    sources=("5-2_RS_2024_支出先_支出ブロックのつながり",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT"),
+        ColumnSpec("source_block", "支出元の支出先ブロック"),
+        ColumnSpec("source_block_name", "支出元の支出先ブロック名", normalize=True),
+        ColumnSpec("from_organization", "担当組織からの支出"),
+        ColumnSpec("destination_block", "支出先の支出先ブロック"),
+        ColumnSpec("destination_block_name", "支出先の支出先ブロック名", normalize=True),
+        ColumnSpec("flow_supplement", "資金の流れの補足情報", normalize=True),
+        ColumnSpec("indirect_cost", "国自らが支出する間接経費"),
+        ColumnSpec("indirect_cost_item", "国自らが支出する間接経費の項目", normalize=True),
+        ColumnSpec("indirect_cost_amount", "国自らが支出する間接経費の金額"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+EXPENDITURE_USAGES = TableSpec(
+    name="expenditure_usages",
+    section="支出先",
+    sources=("5-3_RS_2024_支出先_費目・使途",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT"),
+        ColumnSpec("block_number", "支出先ブロック番号"),
+        ColumnSpec("recipient_name", "支出先名", normalize=True),
+        ColumnSpec("corporate_number", "法人番号"),
+        ColumnSpec("contract_summary", "契約概要", normalize=True),
+        ColumnSpec("expense_item", "費目", normalize=True),
+        ColumnSpec("usage", "使途", normalize=True),
+        ColumnSpec("amount", "金額"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+EXPENDITURE_CONTRACTS = TableSpec(
+    name="expenditure_contracts",
+    section="支出先",
+    sources=("5-4_RS_2024_支出先_国庫債務負担行為等による契約",),
+    columns=(
+        *_project_keys(),
+        ColumnSpec("seq_no", None, "BIGINT"),
+        ColumnSpec("block_number", f"支出先ブロック{_CONTRACT_SUFFIX}"),
+        ColumnSpec("contractor_name", f"契約先名{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("contractor_corporate_number", f"契約先の法人番号{_CONTRACT_SUFFIX}"),
+        ColumnSpec("contractor_location", f"契約先の所在地{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("contractor_type", f"契約先の法人種別{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("contract_summary", f"契約概要（契約名）{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("other_contract", "その他の契約"),
+        ColumnSpec("contract_amount", f"契約額{_CONTRACT_SUFFIX}"),
+        ColumnSpec("contract_method", f"契約方式等{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("specific_contract_method", f"具体的な契約方式等{_CONTRACT_SUFFIX}", normalize=True),
+        ColumnSpec("num_bidders", f"入札者数（応募者数）{_CONTRACT_SUFFIX}"),
+        ColumnSpec("bid_rate", f"落札率（％）{_CONTRACT_SUFFIX}"),
+        ColumnSpec(
+            "sole_bid_reason_text_id",
+            f"一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）{_CONTRACT_SUFFIX}",
+            logical_name=f"一者応札・一者応募又は競争性のない随意契約となった理由及び改善策（契約額10億円以上）{_CONTRACT_SUFFIX}（texts.text_id）",
+            normalize=True,
+            deduplicate=True,
+        ),
+        ColumnSpec("other_contract_detail", f"その他の契約{_CONTRACT_SUFFIX}"),
+    ),
+    primary_keys=("project_year", "project_id", "seq_no"),
+    seq_no_keys=PROJECT_KEY_SOURCES,
+)
+
+EXPENDITURE_TABLES = (EXPENDITURES, EXPENDITURE_FLOWS, EXPENDITURE_USAGES, EXPENDITURE_CONTRACTS)
+
+# セクション（名称, テーブル定義）。構築順（projects_master を最初に構築する）
+SECTIONS = (
+    ("基本情報セクション", BASIC_INFO_TABLES),
+    ("予算・執行セクション", BUDGET_EXECUTION_TABLES),
+    ("支出先セクション", EXPENDITURE_TABLES),
+)
+
+# CSV から構築する全テーブル（seed.sql の記述順）
+TABLE_SPECS = tuple(spec for _, specs in SECTIONS for spec in specs)
+
+
+def render_table_ddl(spec: TableSpec) -> str:
+    """
+    テーブル定義から seed.sql の CREATE TABLE 文とカラムコメントを生成
+
+    Args:
+        spec: テーブル定義
+
+    Returns:
+        CREATE TABLE 文 + 空行 + COMMENT ON COLUMN 文
+    """
+    comment_column = SECTION_COMMENT_COLUMNS[spec.section]
+
+    lines = [f'CREATE TABLE IF NOT EXISTS "{spec.name}" (']
+    for column in spec.columns:
+        line = f'    "{column.name}" {column.data_type},'
+        if column.comment:
+            line = f"{line.ljust(comment_column - 1)} -- {column.comment}"
+        lines.append(line)
+    keys = ", ".join(f'"{key}"' for key in spec.primary_keys)
+    lines.append(f"    PRIMARY KEY ({keys})")
+    lines.append(");")
+    lines.append("")
+    for column in spec.columns:
+        if column.comment:
+            lines.append(f"COMMENT ON COLUMN {spec.name}.{column.name} IS '{column.comment}';")
+    return "\n".join(lines) + "\n"
+
+
+def update_seed_sql(seed_path: Path) -> list[str]:
+    """
+    seed.sql の CSV 由来テーブルの CREATE TABLE 文・カラムコメントをテーブル定義から再生成
+
+    Args:
+        seed_path: seed.sql のパス
+
+    Returns:
+        内容が変わったテーブル名のリスト
+    """
+    sql = seed_path.read_text(encoding="utf-8")
+
+    changed = []
+    for spec in TABLE_SPECS:
+        pattern = re.compile(
+            rf'CREATE TABLE IF NOT EXISTS "{spec.name}" \(.*?\n\);\n\n(?:COMMENT ON COLUMN {spec.name}\.[^\n]*\n)*',
+            re.DOTALL,
+        )
+        ddl = render_table_ddl(spec)
+        match = pattern.search(sql)
+        if match is None:
+            raise ValueError(f"seed.sql に {spec.name} テーブルの定義が見つかりません")
+        if match.group(0) != ddl:
+            sql = sql[:match.start()] + ddl + sql[match.end():]
+            changed.append(spec.name)
+
+    seed_path.write_text(sql, encoding="utf-8")
+    return changed
@@ -0,0 +1,121 @@
+"""
+長文テキストの重複排除モジュール
+
+事業の目的・現状・課題・事業の概要・一者応札の理由などの長文は年度をまたいでほぼ同文が繰り返されるため、
+正規化後のテキストのハッシュ値をテキストID として texts テーブルに 1 度だけ格納し、各テーブルからはテキストID で参照する
+
+CSV の原文のハッシュ値とテキストID の対応をキャッシュに保存し、
+前回までの実行で処理済みの原文はサニタイズ・正規化を省略する
+"""
+
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+from typing import Callable, Optional
+
+import neologdn
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# texts テーブルのテーブル名
+TEXTS_TABLE = "texts"
+
+# キャッシュの形式またはサニタイズ・正規化の処理を変えた場合に更新する（neologdn のバージョンとあわせて照合）
+TEXT_CACHE_VERSION = 2
+
+
+def text_id(text: str) -> str:
+    """テキストID（正規化後のテキストの SHA-1 の先頭 16 桁）"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _raw_hash(raw: str, mode: str) -> str:
+    """CSV の原文と処理の種類のハッシュ値（キャッシュのキー）"""
+    return hashlib.sha1(f"{mode}\0{raw}".encode("utf-8")).hexdigest()
+
+
+class TextStore:
+    """
+    テキストID とテキストの対応
+
+    cache_path を指定した場合は前回までの実行のキャッシュを読み込み、save() で書き戻す
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        # 原文と処理の種類のハッシュ値 → テキストID（サニタイズの結果が空の場合は None）
+        self.raw_ids: dict[str, Optional[str]] = {}
+        # テキストID → テキスト
+        self.texts: dict[str, str] = {}
+        # 今回の実行で参照されたテキストID（texts テーブルに出力する）
+        self.used: set[str] = set()
+
+        if cache_path is not None and cache_path.exists():
+            with cache_path.open("rb") as f:
+                cache = pickle.load(f)
+            if cache.get("version") == self._version():
+                self.raw_ids = cache["raw_ids"]
+                self.texts = cache["texts"]
+                logger.info(f"テキストキャッシュ読み込み: {len(self.texts):,} 件 ({cache_path.name})")
+            else:
+                logger.info("テキストキャッシュのバージョンが異なるため破棄します")
+
+    @staticmethod
+    def _version() -> str:
+        return f"{TEXT_CACHE_VERSION}:{neologdn.__version__}"
+
+    def intern(self, values: pd.Series, process: Callable[[pd.Series], pd.Series], mode: str) -> pd.Series:
+        """
+        長文カラムの値をテキストID に置き換える
+
+        同じ原文は実行内・実行間を通じて 1 度だけ process（サニタイズ・正規化）を適用する
+
+        Args:
+            values: CSV の原文のカラム
+            process: 未処理の原文（異なり値）のカラムをテキストのカラムに変換する関数（サニタイズ・正規化）
+            mode: process の処理の種類（同じ原文でも処理が異なる場合は別々にキャッシュする）
+
+        Returns:
+            テキストID のカラム（空の値は None）
+        """
+        raws = pd.Series(values.dropna().unique(), name=values.name, dtype=object)
+        keys = raws.map(lambda raw: _raw_hash(raw, mode))
+        unseen = ~keys.map(self.raw_ids.__contains__).astype(bool)
+
+        if unseen.any():
+            for key, text in zip(keys[unseen], process(raws[unseen])):
+                if text is None:
+                    self.raw_ids[key] = None
+                else:
+                    self.raw_ids[key] = text_id(text)
+                    self.texts.setdefault(self.raw_ids[key], text)
+
+        ids = dict(zip(raws, (self.raw_ids[key] for key in keys)))
+        self.used.update(value for value in ids.values() if value is not None)
+
+        logger.info(
+            f"  長文の重複排除: {values.name} 異なり {len(raws):,} 件"
+            f"（処理 {int(unseen.sum()):,} 件, キャッシュ利用 {int((~unseen).sum()):,} 件）"
+        )
+
+        return values.map(ids).astype(object).where(values.notna(), None)
+
+    def to_table(self) -> pd.DataFrame:
+        """今回の実行で参照されたテキストから texts テーブルを構築"""
+        used = sorted(self.used)
+        result = pd.DataFrame({"text_id": used, "text": [self.texts[i] for i in used]})
+
+        logger.info(f"  {TEXTS_TABLE} テーブル完成: {len(result):,} 行")
+
+        return result
+
+    def save(self) -> None:
+        """キャッシュを書き戻す"""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.cache_path.open("wb") as f:
+            pickle.dump({"version": self._version(), "raw_ids": self.raw_ids, "texts": self.texts}, f)
+        logger.info(f"テキストキャッシュを保存しました: {self.cache_path} ({len(self.texts):,} 件)")
@@ -0,0 +1,136 @@
+"""
+Supabase アップロードモジュール
+
+構築済みテーブルをバッチ単位で Supabase に upsert する
+バッチごとにチェックポイントを記録し、中断したアップロードを途中から再開できるようにする
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+from supabase import Client
+
+from .serialize import iter_json_batches
+
+logger = logging.getLogger(__name__)
+
+# 1 回の upsert で送信する行数
+BATCH_SIZE = 1000
+
+
+def table_hash(df: pd.DataFrame) -> str:
+    """テーブルの内容ハッシュ（カラム名 + 全セルの値）"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def load_checkpoint(path: Path) -> dict:
+    """チェックポイントを読み込む（存在しない場合は空）"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_checkpoint(path: Path, checkpoint: dict) -> None:
+    """チェックポイントを書き込む（書き込み途中で中断しても壊れないよう置き換えで保存）"""
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(checkpoint, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def post_batch(supabase: Client, table_name: str, payload: bytes) -> None:
+    """
+    エンコード済みの JSON をそのまま PostgREST に upsert（主キー重複時は更新）
+
+    Supabase クライアントの upsert() は Python オブジェクトを再度シリアライズするため、
+    クライアントの HTTP セッション（接続先・認証ヘッダー設定済み）で直接送信する
+    """
+    response = supabase.postgrest.session.post(
+        table_name,
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "Prefer": "resolution=merge-duplicates,return=minimal",
+        },
+    )
+    response.raise_for_status()
+
+
+def upload_table(supabase: Client, table_name: str, df: pd.DataFrame, checkpoint: dict, checkpoint_path: Path) -> int:
+    """
+    テーブルをバッチ単位で upsert し、バッチごとにチェックポイントを更新
+
+    チェックポイントのテーブル内容ハッシュ・バッチサイズが一致する場合のみ、
+    最後に完了したバッチの次から再開する
+
+    Args:
+        supabase: Supabase クライアント
+        table_name: テーブル名
+        df: 対象 DataFrame
+        checkpoint: チェックポイント（テーブル名 → 進捗）
+        checkpoint_path: チェックポイントファイルのパス
+
+    Returns:
+        今回送信した行数（書き込み済みのバッチは含まない）
+    """
+    content_hash = table_hash(df)
+    total_batches = (len(df) + BATCH_SIZE - 1) // BATCH_SIZE
+
+    state = checkpoint.get(table_name)
+    if state and state["hash"] == content_hash and state["batch_size"] == BATCH_SIZE:
+        start_batch = state["last_batch"] + 1
+    else:
+        start_batch = 0
+        state = {"hash": content_hash, "batch_size": BATCH_SIZE, "total_batches": total_batches, "last_batch": -1}
+        checkpoint[table_name] = state
+
+    if start_batch >= total_batches:
+        logger.info(f"  {table_name} テーブルは書き込み済みのためスキップ")
+        return 0
+
+    if start_batch > 0:
+        logger.info(f"  {table_name} テーブル書き込み再開... (バッチ {start_batch + 1}/{total_batches} から)")
+    else:
+        logger.info(f"  {table_name} テーブル書き込み中... ({len(df):,} 行)")
+
+    for batch_index, payload in iter_json_batches(df, BATCH_SIZE, start_batch):
+        post_batch(supabase, table_name, payload)
+
+        state["last_batch"] = batch_index
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    logger.info(f"  {table_name} テーブル書き込み完了")
+    return len(df) - start_batch * BATCH_SIZE
+
+
+def upload_tables(
+    supabase: Client, tables: dict[str, pd.DataFrame], checkpoint_path: Path, resume: bool = False
+) -> int:
+    """
+    全テーブルを Supabase に書き込む
+
+    Args:
+        supabase: Supabase クライアント
+        tables: テーブル名をキー、DataFrame を値とする辞書（外部キーの参照順）
+        checkpoint_path: チェックポイントファイルのパス
+        resume: True の場合、チェックポイントから再開する
+
+    Returns:
+        今回送信した行数の合計
+    """
+    logger.info("\n" + "=" * 60)
+    logger.info("Supabase に書き込み")
+    logger.info("=" * 60)
+
+    checkpoint = load_checkpoint(checkpoint_path) if resume else {}
+
+    rows = sum(upload_table(supabase, table_name, df, checkpoint, checkpoint_path) for table_name, df in tables.items())
+
+    logger.info("全テーブルの書き込みが完了しました")
+    return rows
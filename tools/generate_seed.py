@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+seed.sql 生成スクリプト
+
+build_database/spec.py のカラム対応定義から、supabase/seed.sql の CSV 由来テーブルの
+CREATE TABLE 文・カラムコメントを再生成する
+"""
+
+import logging
+from pathlib import Path
+
+from build_database.spec import update_seed_sql
+
+# 定数
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SEED_SQL_PATH = PROJECT_ROOT / "supabase" / "seed.sql"
+
+# ロギング設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """メイン処理"""
+    changed = update_seed_sql(SEED_SQL_PATH)
+    if changed:
+        logger.info(f"テーブル定義を更新しました: {', '.join(changed)}")
+    else:
+        logger.info("テーブル定義に変更はありません")
+
+
+if __name__ == "__main__":
+    main()
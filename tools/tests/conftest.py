@@ -0,0 +1,6 @@
+"""tools/build_database パッケージを import できるよう tools/ を import パスに追加"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,90 @@
+"""予算キューブ（budget_cube.py）のテスト"""
+
+import pandas as pd
+
+from build_database.budget_cube import BUDGET_MEASURES, DIMENSIONS, GROUPING_SETS, build_budget_cube, grouping_id
+
+PROJECTS = pd.DataFrame({
+    "project_year": [2024, 2024, 2024],
+    "project_id": ["001", "002", "003"],
+    "ministry": ["財務省", "財務省", "総務省"],
+    "bureau": ["主計局", "理財局", "自治行政局"],
+})
+
+
+def _budget(project_id, account_category, account, initial, current, execution):
+    return {
+        "project_year": 2024, "project_id": project_id, "budget_year": 2024,
+        "account_category": account_category, "account": account,
+        "initial_budget": initial, "current_budget": current, "execution_amount": execution,
+        **{f"supplementary_budget_{i}": None for i in range(1, 6)},
+    }
+
+
+BUDGETS = pd.DataFrame([
+    # 001: 会計ごとの行 + 合計行
+    _budget("001", "一般会計", "一般会計", "100", "100", "80"),
+    _budget("001", "特別会計", "エネルギー対策特別会計", "1,000", "1,000", "900"),
+    _budget("001", None, None, "1,100", "1,100", "980"),
+    # 002: 会計の記載がない行のみ
+    _budget("002", None, None, "50", "50", "40"),
+])
+
+BUDGET_ITEMS = pd.DataFrame({
+    "project_year": [2024, 2024],
+    "project_id": ["001", "001"],
+    "budget_year": [2024, 2024],
+    "account_category": ["一般会計", "特別会計"],
+    "budget_item": ["項A", "項B"],
+    "budget_amount": ["100", "1,000"],
+})
+
+
+def _cell(cube, dimensions, **values):
+    cells = cube[cube["grouping_id"] == grouping_id(dimensions)]
+    for dimension, value in values.items():
+        cells = cells[cells[dimension] == value]
+    assert len(cells) == 1
+    return cells.iloc[0]
+
+
+def test_grouping_id_sets_bits_of_rolled_up_dimensions():
+    assert grouping_id(DIMENSIONS) == 0
+    assert grouping_id([]) == (1 << len(DIMENSIONS)) - 1
+    assert grouping_id(["budget_year", "ministry"]) == 1 + 8 + 16 + 32
+    assert len({grouping_id(dimensions) for dimensions in GROUPING_SETS}) == len(GROUPING_SETS) == 48
+
+
+def test_total_rows_are_excluded_and_account_less_projects_are_kept():
+    cube = build_budget_cube(PROJECTS, BUDGETS, BUDGET_ITEMS)
+
+    total = _cell(cube, [])
+    # 001 の合計行を二重計上せず、002 の会計の記載がない行は集計する
+    assert total["initial_budget"] == 1_150
+    assert total["execution_amount"] == 1_020
+    assert total["project_count"] == 2
+    assert total["budget_amount"] == 1_100
+
+    by_ministry = _cell(cube, ["ministry"], ministry="財務省")
+    assert by_ministry["current_budget"] == 1_150
+    assert by_ministry["execution_rate"] == round(1_020 / 1_150, 4)
+
+    special = _cell(cube, ["account_category"], account_category="特別会計")
+    assert special["initial_budget"] == 1_000
+
+    # 項を含む組み合わせは budgets 由来の集計値を持たない
+    item = _cell(cube, ["budget_item"], budget_item="項A")
+    assert item["budget_amount"] == 100
+    assert item[BUDGET_MEASURES].isna().all()
+
+    assert cube["cell_id"].is_unique
+
+
+def test_total_row_not_matching_account_rows_is_kept(caplog):
+    budgets = BUDGETS.copy()
+    budgets.loc[2, "initial_budget"] = "2,000"
+
+    cube = build_budget_cube(PROJECTS, budgets, BUDGET_ITEMS)
+
+    assert _cell(cube, [])["initial_budget"] == 1_100 + 2_000 + 50
+    assert "一致しない行を明細として集計: 1 行" in caplog.text
@@ -0,0 +1,42 @@
+"""メインスクリプト（build_database.py）のテスト"""
+
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from build_database.cache import save_tables
+from build_database.metrics import RunRecorder
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "build_database.py"
+
+
+@pytest.fixture(scope="module")
+def script():
+    # build_database パッケージと名前が衝突するため、ファイルから読み込む
+    spec = importlib.util.spec_from_file_location("build_database_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_sampled_upload_to_supabase_requires_allow_sample(script):
+    with pytest.raises(SystemExit):
+        script.parse_args(["--sample", "0.05"])
+    with pytest.raises(SystemExit):
+        script.parse_args(["all", "--target", "supabase", "--sample", "0.05"])
+
+    assert script.parse_args(["--sample", "0.05", "--allow-sample"]).sample == 0.05
+    # 組み込みデータベースへの書き出しはサンプリング可
+    assert script.parse_args(["--target", "sqlite:rs.sqlite", "--sample", "0.05"]).sample == 0.05
+
+
+def test_load_refuses_sampled_cache(script, tmp_path, monkeypatch):
+    save_tables({"projects_master": pd.DataFrame({"id": [1]})}, tmp_path, sample_fraction=0.05)
+    monkeypatch.setattr(script, "TABLES_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(script, "connect_supabase", lambda: pytest.fail("サンプリングしたキャッシュを登録しようとした"))
+
+    for argv in (["load"], ["load", "--resume"], ["all", "--resume"]):
+        args = script.parse_args(argv)
+        assert args.handler(args, RunRecorder(args.command, {})) == 1
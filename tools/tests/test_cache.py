@@ -0,0 +1,25 @@
+"""構築済みテーブルのキャッシュ（cache.py）のテスト"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from build_database.cache import MANIFEST_FILENAME, load_manifest, load_tables, save_tables
+
+
+def test_manifest_records_sample_fraction(tmp_path):
+    tables = {"projects_master": pd.DataFrame({"id": [1, 2]}), "budgets": pd.DataFrame({"id": [3]})}
+
+    save_tables(tables, tmp_path, sample_fraction=0.05)
+
+    assert load_manifest(tmp_path) == {"tables": ["projects_master", "budgets"], "sample_fraction": 0.05}
+    assert list(load_tables(tmp_path)) == ["projects_master", "budgets"]
+
+
+def test_manifest_without_sample_fraction_is_rejected(tmp_path):
+    # 抽出割合を記録していない形式（テーブル一覧のみ）
+    (tmp_path / MANIFEST_FILENAME).write_text(json.dumps(["projects_master"]), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_manifest(tmp_path)
@@ -0,0 +1,52 @@
+"""共通関数（common.py）のテスト"""
+
+import pandas as pd
+
+from build_database.common import build_table, load_csv
+from build_database.spec import ColumnSpec, TableSpec
+from build_database.texts import TextStore
+
+
+def _text_spec(name: str, normalize: bool) -> TableSpec:
+    return TableSpec(
+        name=name,
+        section="基本情報",
+        sources=("source",),
+        columns=(
+            ColumnSpec("project_year", "事業年度", "BIGINT"),
+            ColumnSpec("project_id", "予算事業ID"),
+            ColumnSpec("text_id", "長文", normalize=normalize, deduplicate=True),
+        ),
+        primary_keys=("project_year", "project_id"),
+    )
+
+
+def test_deduplicated_column_follows_normalize_flag():
+    source = pd.DataFrame({"事業年度": ["2024"], "予算事業ID": ["001"], "長文": [" ＡＢＣ　１２３ "]})
+    text_store = TextStore()
+
+    normalized = build_table(_text_spec("normalized", True), {"source": source}, text_store)
+    sanitized = build_table(_text_spec("sanitized", False), {"source": source}, text_store)
+
+    texts = text_store.to_table().set_index("text_id")["text"]
+    assert texts[normalized["text_id"].iloc[0]] == "ABC 123"
+    # 同じ原文でも正規化しないカラムは別のテキストとして格納する
+    assert texts[sanitized["text_id"].iloc[0]] == "ＡＢＣ　１２３"
+
+
+def test_sampled_csv_keeps_header_without_rows(tmp_path):
+    filepath = tmp_path / "header_only.csv"
+    filepath.write_text("事業年度,予算事業ID,事業名\n", encoding="utf-8-sig")
+
+    expected = list(load_csv(filepath).columns)
+    assert expected == ["事業年度", "予算事業ID", "事業名"]
+    assert list(load_csv(filepath, sample_fraction=0.5).columns) == expected
+
+
+def test_sampled_csv_keeps_header_when_every_row_is_filtered(tmp_path):
+    filepath = tmp_path / "rows.csv"
+    filepath.write_text("事業年度,予算事業ID,事業名\n2024,001,事業A\n2024,002,事業B\n", encoding="utf-8-sig")
+
+    df = load_csv(filepath, sample_fraction=1e-12)
+    assert df.empty
+    assert list(df.columns) == ["事業年度", "予算事業ID", "事業名"]
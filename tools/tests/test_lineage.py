@@ -0,0 +1,72 @@
+"""事業系譜（lineage.py）のテスト"""
+
+import pandas as pd
+
+from build_database.lineage import MAX_PROJECTS_PER_OLD_NUMBER, build_project_lineage
+
+
+def _projects(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["project_year", "project_id", "old_project_number"])
+
+
+def _related(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["project_id", "related_project_id", "relation_type"])
+
+
+def _lineage_ids(result: pd.DataFrame) -> dict[tuple, str]:
+    return {
+        (int(year), project_id): lineage_id
+        for year, project_id, lineage_id in result[["project_year", "project_id", "lineage_id"]].itertuples(index=False)
+    }
+
+
+def test_projects_are_merged_by_id_old_number_and_succession():
+    projects = _projects([
+        (2022, "0001", None),
+        (2023, "0001", None),
+        (2024, "0002", "0001"),  # 旧事業番号が別の事業の予算事業ID
+        (2023, "0003", "0012"),
+        (2024, "0004", "0012、0034"),  # 旧事業番号が同じ（複数記載）
+        (2024, "0005", None),
+        (2024, "0006", None),
+        (2024, "0007", None),
+    ])
+    related = _related([
+        ("0005", "0003", "統合"),
+        ("0007", "0006", "関連"),  # 継承関係でない関連事業は結合しない
+    ])
+
+    result = build_project_lineage(projects, related)
+    ids = _lineage_ids(result)
+
+    assert ids[(2022, "0001")] == ids[(2023, "0001")] == ids[(2024, "0002")] == "0001"
+    assert ids[(2023, "0003")] == ids[(2024, "0004")] == ids[(2024, "0005")] == "0003"
+    assert ids[(2024, "0006")] == "0006"
+    assert ids[(2024, "0007")] == "0007"
+
+    lineage_a = result[result["lineage_id"] == "0001"].set_index(["project_year", "project_id"])
+    assert lineage_a["year_sequence"].tolist() == [1, 2, 3]
+    assert lineage_a["project_count"].unique().tolist() == [2]
+    assert lineage_a["lineage_years"].iloc[0] == [2022, 2023, 2024]
+
+
+def test_old_number_without_digits_is_ignored():
+    projects = _projects([(2023, "0001", "新規"), (2024, "0002", "新規")])
+
+    ids = _lineage_ids(build_project_lineage(projects, _related([])))
+
+    assert ids == {(2023, "0001"): "0001", (2024, "0002"): "0002"}
+
+
+def test_old_number_shared_by_too_many_projects_is_not_merged(caplog):
+    shared = [(2024, f"P{i}", "9999") for i in range(MAX_PROJECTS_PER_OLD_NUMBER + 1)]
+    limit = [(2024, f"Q{i}", "0099") for i in range(MAX_PROJECTS_PER_OLD_NUMBER)]
+    projects = _projects(shared + limit)
+
+    result = build_project_lineage(projects, _related([]))
+    ids = _lineage_ids(result)
+
+    assert len({ids[(2024, f"P{i}")] for i in range(len(shared))}) == len(shared)
+    # 上限ちょうどの件数は結合する
+    assert {ids[(2024, f"Q{i}")] for i in range(len(limit))} == {"Q0"}
+    assert "1 件の旧事業番号は共有する事業が多すぎるため結合しません" in caplog.text
@@ -0,0 +1,111 @@
+"""実行履歴メトリクス（metrics.py）のテスト"""
+
+import pytest
+
+from build_database.metrics import RunRecorder, StageMetrics, compare_run, write_prometheus_textfile
+
+
+def _record(history_path, stages, command="load", arguments=None, sample_fraction=None, status="success"):
+    recorder = RunRecorder(command, arguments or {"resume": False}, sample_fraction)
+    for stage, seconds, rows in stages:
+        recorder.add(StageMetrics(stage, seconds, rows))
+    return recorder.save(history_path, status)
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    path = tmp_path / "run_history.sqlite"
+    # 基準: 行数/秒の中央値 1,000、処理時間の中央値 10 秒
+    for rows_per_second, seconds in ((900, 9), (1_000, 10), (1_100, 11)):
+        _record(path, [("load", 10, rows_per_second * 10), ("extract", seconds, None)])
+    return path
+
+
+def _comparisons(history_path, run_id, **kwargs):
+    return {comparison.stage: comparison for comparison in compare_run(history_path, run_id, **kwargs)[1]}
+
+
+def test_throughput_regression_beyond_threshold(history_path):
+    run_id = _record(history_path, [("load", 10, 7_900), ("extract", 12.5, None)])
+
+    comparisons = _comparisons(history_path, run_id)
+
+    assert comparisons["load"].metric == "rows_per_second"
+    assert comparisons["load"].baseline == 1_000
+    assert comparisons["load"].change == pytest.approx(-0.21)
+    assert comparisons["load"].regressed
+    # 行数のない段階は処理時間の増加率（+25%）で比較
+    assert comparisons["extract"].metric == "seconds"
+    assert comparisons["extract"].regressed
+
+    comparisons = _comparisons(history_path, run_id, threshold=0.3)
+    assert not comparisons["load"].regressed
+    assert not comparisons["extract"].regressed
+
+
+def test_change_within_threshold_is_not_regression(history_path):
+    run_id = _record(history_path, [("load", 10, 8_500), ("extract", 11.5, None)])
+
+    comparisons = _comparisons(history_path, run_id)
+
+    assert not comparisons["load"].regressed
+    assert not comparisons["extract"].regressed
+
+
+def test_short_stages_are_not_compared(history_path):
+    _record(history_path, [("validate", 0.2, 1_000)])
+    run_id = _record(history_path, [("validate", 0.5, 1_000)])
+
+    assert "validate" not in _comparisons(history_path, run_id)
+
+
+def test_baseline_uses_runs_with_same_arguments_and_sample(history_path):
+    # 出力先・再開の有無・抽出割合が異なる実行、失敗した実行は基準に含めない
+    _record(history_path, [("load", 10, 100)], arguments={"resume": True})
+    _record(history_path, [("load", 10, 100)], sample_fraction=0.05)
+    _record(history_path, [("load", 10, 100)], status="failed")
+    _record(history_path, [("load", 10, 100)], command="all")
+    run_id = _record(history_path, [("load", 10, 10_000)])
+
+    comparison = _comparisons(history_path, run_id)["load"]
+
+    assert comparison.baseline_runs == 3
+    assert comparison.baseline == 1_000
+
+    resumed = _record(history_path, [("load", 10, 100)], arguments={"resume": True})
+    assert _comparisons(history_path, resumed)["load"].baseline_runs == 1
+
+
+def test_window_limits_baseline_runs(history_path):
+    run_id = _record(history_path, [("load", 10, 10_000)])
+
+    comparison = _comparisons(history_path, run_id, window=1)["load"]
+
+    assert comparison.baseline_runs == 1
+    assert comparison.baseline == 1_100
+
+
+def test_stage_without_rows_is_compared_by_seconds(history_path):
+    # 再開時に全て書き込み済み（送信 0 行）の段階は行数/秒ではなく処理時間で比較
+    _record(history_path, [("load", 10, 0)])
+    run_id = _record(history_path, [("load", 1.5, 0)])
+
+    comparison = _comparisons(history_path, run_id)["load"]
+
+    assert comparison.metric == "seconds"
+    assert not comparison.regressed
+
+
+def test_prometheus_textfile_excludes_table_breakdown(tmp_path):
+    recorder = RunRecorder("build", {})
+    recorder.add(StageMetrics("build/projects_master", 1.0, 10))
+    recorder.add(StageMetrics("build", 2.0, 20, 1024))
+    output_path = tmp_path / "metrics" / "build_database_build.prom"
+
+    write_prometheus_textfile(recorder, "success", [], output_path)
+
+    text = output_path.read_text(encoding="utf-8")
+    assert 'rs_build_stage_rows_per_second{command="build",stage="build"} 10.0' in text
+    assert 'rs_build_last_run_success{command="build"} 1.0' in text
+    assert "projects_master" not in text
+    assert list(output_path.parent.iterdir()) == [output_path]
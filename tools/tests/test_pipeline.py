@@ -0,0 +1,106 @@
+"""テーブル構築とアップロードの並行実行（pipeline.py）のテスト"""
+
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from build_database import upload
+from build_database.cache import load_tables, save_manifest, save_table
+from build_database.pipeline import run_pipeline
+from build_database.upload import upload_table, upload_tables
+
+TABLE_NAMES = ["projects_master", "budgets", "expenditures", "catalog"]
+
+
+class _Response:
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _Session:
+    """PostgREST の HTTP セッションの代わり（fail_table への書き込みで例外を送出）"""
+
+    def __init__(self, fail_table=None):
+        self.fail_table = fail_table
+        self.failed = threading.Event()
+        self.posted = []
+
+    def post(self, table_name, content, headers):
+        if table_name == self.fail_table:
+            self.failed.set()
+            raise ConnectionError(f"upload failed: {table_name}")
+        self.posted.append((table_name, len(json.loads(content))))
+        return _Response()
+
+
+class _Client:
+    def __init__(self, session):
+        self.postgrest = type("PostgREST", (), {"session": session})()
+
+
+def _iter_tables(cache_dir, session):
+    """
+    iter_tables と同様に、構築したテーブルを順に保存し、最後にテーブル一覧を保存
+
+    アップロードの失敗後に残りのテーブルを構築する状況を再現するため、失敗したテーブルを返した後は失敗を待つ
+    """
+    for i, table_name in enumerate(TABLE_NAMES):
+        df = pd.DataFrame({"id": range(i * 10, i * 10 + 5)})
+        save_table(df, table_name, cache_dir)
+        yield table_name, df
+        if table_name == session.fail_table:
+            assert session.failed.wait(timeout=10)
+    save_manifest(TABLE_NAMES, cache_dir)
+
+
+def test_consumer_error_is_raised():
+    def consume(item):
+        if item == 2:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_pipeline(iter(range(5)), consume)
+
+
+def test_failed_pipelined_upload_can_be_resumed(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "BATCH_SIZE", 2)
+    cache_dir = tmp_path / "tables"
+    checkpoint_path = tmp_path / "upload_checkpoint.json"
+
+    session = _Session(fail_table="expenditures")
+    client = _Client(session)
+    checkpoint = {}
+
+    with pytest.raises(ConnectionError):
+        run_pipeline(
+            _iter_tables(cache_dir, session),
+            lambda item: upload_table(client, item[0], item[1], checkpoint, checkpoint_path),
+        )
+
+    # 失敗後のテーブルも構築・保存され、テーブル一覧が揃っている
+    assert {table_name for table_name, _ in session.posted} == {"projects_master", "budgets"}
+    tables = load_tables(cache_dir)
+    assert list(tables) == TABLE_NAMES
+
+    # キャッシュとチェックポイントから再開し、書き込み済みのテーブルはスキップする
+    session = _Session()
+    sent = upload_tables(_Client(session), tables, checkpoint_path, resume=True)
+    assert [table_name for table_name, _ in session.posted] == ["expenditures"] * 3 + ["catalog"] * 3
+    # 書き込み済みのテーブルの行数は含めない
+    assert sent == 10
+
+
+def test_resumed_upload_counts_only_remaining_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "BATCH_SIZE", 2)
+    checkpoint_path = tmp_path / "upload_checkpoint.json"
+    df = pd.DataFrame({"id": range(5)})
+    # 3 バッチのうち 1 バッチ目まで書き込み済み
+    checkpoint = {"budgets": {"hash": upload.table_hash(df), "batch_size": 2, "total_batches": 3, "last_batch": 0}}
+
+    session = _Session()
+    sent = upload_table(_Client(session), "budgets", df, checkpoint, checkpoint_path)
+
+    assert sent == 3
+    assert [rows for _, rows in session.posted] == [2, 1]
@@ -0,0 +1,32 @@
+"""支出先の名寄せ（recipients.py）のテスト"""
+
+import pandas as pd
+
+from build_database.recipients import _minhash_candidates, resolve_recipients
+
+
+def test_placeholder_names_without_corporate_number_are_not_resolved():
+    # 名寄せキーが空になる名称（仮の名称・法人格のみ）で法人番号もない支出先
+    df = pd.DataFrame({
+        "recipient_name": ["-", "・", "株式会社", "株式会社テスト", "テスト株式会社", "-"],
+        "corporate_number": [None, None, None, None, None, "1234567890123"],
+    })
+
+    result, recipients = resolve_recipients(df)
+
+    assert result["recipient_id"].iloc[:3].isna().all()
+    # 表記ゆれは統合される
+    assert result["recipient_id"].iloc[3] == result["recipient_id"].iloc[4]
+    # 法人番号があれば名称が空でも支出先IDを付与する
+    assert result["recipient_id"].iloc[5] == "1234567890123"
+    assert set(recipients["recipient_id"]) == {result["recipient_id"].iloc[3], "1234567890123"}
+
+
+def test_minhash_candidates_include_all_pairs_in_bucket():
+    # 同じ署名のキーは全バンドで同じバケットに入る
+    keys = ["テスト研究所", "テスト研究所", "テスト研究所", "まったく別の名称"]
+
+    candidates = _minhash_candidates(keys)
+
+    assert {(0, 1), (0, 2), (1, 2)} <= candidates
+    assert all(i < j for i, j in candidates)
@@ -0,0 +1,61 @@
+"""全文検索インデックス（search.py）のテスト"""
+
+import sqlite3
+
+import pandas as pd
+
+from build_database.search import build_search_index, search_projects
+from build_database.texts import text_id
+
+
+def _connect(tables: dict[str, pd.DataFrame]) -> sqlite3.Connection:
+    con = sqlite3.connect(":memory:")
+    for name, df in build_search_index(tables).items():
+        df.to_sql(name, con, index=False)
+    return con
+
+
+def _tables() -> dict[str, pd.DataFrame]:
+    purpose = "再生可能エネルギーの導入を支援する"
+    return {
+        "projects_master": pd.DataFrame({
+            "project_year": [2024, 2024, 2024],
+            "project_id": ["0001", "0002", "0003"],
+            "project_name": ["太陽光発電の普及", "道路の整備", "ＡＩ研究開発"],
+            "purpose_text_id": [text_id(purpose), None, None],
+            "current_issues_text_id": [None, None, None],
+            "overview_text_id": [None, None, None],
+        }),
+        "expenditures": pd.DataFrame({
+            "project_year": [2024],
+            "project_id": ["0002"],
+            "contract_summary": ["橋梁の点検業務"],
+        }),
+        "texts": pd.DataFrame({"text_id": [text_id(purpose)], "text": [purpose]}),
+    }
+
+
+def test_index_covers_project_texts_and_contract_summaries():
+    con = _connect(_tables())
+
+    # テキストID で参照する長文は texts テーブルのテキストで索引付けする
+    assert [row[1] for row in search_projects(con, "エネルギー")] == ["0001"]
+    assert [row[1] for row in search_projects(con, "点検")] == ["0002"]
+    # 全角英字は正規化・小文字化して索引付けする
+    assert [row[1] for row in search_projects(con, "ai")] == ["0003"]
+
+
+def test_query_requires_every_bigram():
+    con = _connect(_tables())
+
+    assert search_projects(con, "太陽光") != []
+    # 一部の bigram（「太陽」）のみ一致する事業は返さない
+    assert search_projects(con, "太陽熱") == []
+    assert search_projects(con, "  ") == []
+
+
+def test_single_character_query_matches_bigram_prefix():
+    con = _connect(_tables())
+
+    assert {row[1] for row in search_projects(con, "道")} == {"0002"}
+    assert {row[1] for row in search_projects(con, "の")} == {"0001", "0002"}
@@ -0,0 +1,33 @@
+"""JSON シリアライズ（serialize.py）のテスト"""
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from build_database.serialize import encode_batch, iter_json_batches
+
+
+def test_missing_values_are_encoded_as_null():
+    df = pd.DataFrame({
+        "amount": [1.5, np.nan],
+        "count": pd.array([1, pd.NA], dtype="Int64"),
+        "name": ["支出先", None],
+        "flag": pd.array([True, pd.NA], dtype="boolean"),
+    })
+
+    records = orjson.loads(encode_batch(df))
+
+    assert records[0]["amount"] == 1.5
+    assert records[0]["count"] == 1
+    assert records[0]["name"] == "支出先"
+    assert records[0]["flag"] is True
+    assert records[1] == {"amount": None, "count": None, "name": None, "flag": None}
+
+
+def test_batches_resume_from_start_batch():
+    df = pd.DataFrame({"id": range(5)})
+
+    batches = list(iter_json_batches(df, batch_size=2, start_batch=1))
+
+    assert [index for index, _ in batches] == [1, 2]
+    assert [[record["id"] for record in orjson.loads(body)] for _, body in batches] == [[2, 3], [4]]
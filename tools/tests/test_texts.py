@@ -0,0 +1,67 @@
+"""長文テキストの重複排除（texts.py）のテスト"""
+
+import pickle
+
+import pandas as pd
+
+from build_database.texts import TextStore, text_id
+
+
+def _upper(raws: pd.Series) -> pd.Series:
+    return raws.str.strip().str.upper().where(raws.str.strip() != "", None)
+
+
+def test_text_id_is_stable_content_hash():
+    # テキストID は実行・環境によらず同じテキストから同じ値になる（キャッシュ・参照の整合性の前提）
+    assert text_id("事業の目的") == "d63fd18323665664"
+    assert text_id("事業の目的") != text_id("事業の目的 ")
+
+
+def test_intern_deduplicates_and_skips_empty_texts():
+    store = TextStore()
+    values = pd.Series(["abc", " abc ", "abc", " ", None], name="purpose")
+
+    ids = store.intern(values, _upper, "sanitize")
+
+    # 原文が異なっても処理後のテキストが同じなら同じテキストID
+    assert ids.iloc[0] == ids.iloc[1] == ids.iloc[2] == text_id("ABC")
+    assert ids.iloc[3] is None and ids.iloc[4] is None
+    assert store.to_table().to_dict("records") == [{"text_id": text_id("ABC"), "text": "ABC"}]
+
+
+def test_cached_raw_texts_are_not_processed_again(tmp_path):
+    cache_path = tmp_path / "texts.pkl"
+    values = pd.Series(["abc", "def"], name="purpose")
+
+    store = TextStore(cache_path)
+    first = store.intern(values, _upper, "sanitize")
+    store.save()
+
+    processed = []
+
+    def _record(raws: pd.Series) -> pd.Series:
+        processed.extend(raws)
+        return _upper(raws)
+
+    reloaded = TextStore(cache_path)
+    second = reloaded.intern(pd.Series(["abc", "def", "ghi"], name="purpose"), _record, "sanitize")
+    # 処理の種類が異なれば同じ原文も処理し直す
+    reloaded.intern(pd.Series(["abc"], name="purpose"), _record, "normalize")
+
+    assert second.iloc[:2].tolist() == first.tolist()
+    assert processed == ["ghi", "abc"]
+
+
+def test_cache_with_other_version_is_discarded(tmp_path):
+    cache_path = tmp_path / "texts.pkl"
+    store = TextStore(cache_path)
+    store.intern(pd.Series(["abc"], name="purpose"), _upper, "sanitize")
+    store.save()
+
+    with cache_path.open("rb") as f:
+        cache = pickle.load(f)
+    cache["version"] = "0:0"
+    with cache_path.open("wb") as f:
+        pickle.dump(cache, f)
+
+    assert TextStore(cache_path).raw_ids == {}